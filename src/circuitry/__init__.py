@@ -3,4 +3,4 @@
 from circuitry.circuitry import \
     bit, constant, input, input_one, input_two, output, \
     bits, constants, inputs, outputs, \
-    synthesize
+    evaluate_many, synthesize
@@ -10,11 +10,128 @@ the :obj:`synthesize` function).
 """
 from __future__ import annotations
 from typing import Sequence, Union, Optional, Callable
-import doctest
 import inspect
+from itertools import product, accumulate
 from parts import parts
 from circuit import op, circuit, signature
 
+# Truth tables of the unary and binary operations applied by the methods of
+# the :obj:`bit` class. Each table is indexed by the integer that has the
+# argument values as its binary representation (*e.g.*, ``2 * x + y`` for a
+# binary operation applied to ``x`` and ``y``).
+# pylint: disable=not-callable # Operations are callable ``logical`` instances.
+_TRUTH_TABLES = {
+    **{o: (o(0), o(1)) for o in (op.id_, op.not_)},
+    **{
+        o: (o(0, 0), o(0, 1), o(1, 0), o(1, 1))
+        for o in (
+            op.and_, op.nimp_, op.nif_, op.xor_, op.or_,
+            op.nor_, op.xnor_, op.if_, op.imp_, op.nand_
+        )
+    }
+}
+# pylint: enable=not-callable
+
+# Binary operations whose result does not depend on the order of their
+# arguments. Keys in the table of subexpressions list the input gates of
+# these operations in a canonical order (see :obj:`bit.gate`).
+_SYMMETRIC = frozenset(o for (o, t) in _TRUTH_TABLES.items() if len(t) == 4 and t[1] == t[2])
+
+class _gate_method(staticmethod): # pylint: disable=invalid-name # Private counterpart of ``staticmethod``.
+    """
+    Static method that doubles as the ``gate`` attribute of :obj:`bit` instances.
+    Accessing it via a class yields the static method, while accessing (or
+    assigning) it via an instance retrieves (or updates) the gate stored in
+    the ``_gate`` slot of that instance. This makes it possible for :obj:`bit`
+    to use slots without changing its interface.
+
+    >>> bit.circuit(circuit())
+    >>> b = input(1)
+    >>> b.gate is b._gate
+    True
+    >>> callable(bit.gate)
+    True
+    >>> g = b.gate
+    >>> b.gate = None
+    >>> b._gate is None
+    True
+    >>> b.gate = g
+    >>> _ = bit.circuit() # Remove designated circuit.
+    """
+    def __get__(self, instance, owner=None):
+        if instance is None:
+            return super().__get__(instance, owner)
+        return instance._gate # pylint: disable=protected-access
+
+    def __set__(self, instance, value):
+        instance._gate = value # pylint: disable=protected-access
+
+def _operation_method(owner: str, name: str, o: op, example: str) -> Callable:
+    """
+    Build a method of the :obj:`bit` class or of the :obj:`bits` class (as
+    specified by the supplied class name) that applies the supplied unary or
+    binary operation to its instance (and to another argument). The docstring
+    of the method demonstrates its use via the supplied example expression
+    (which refers to ``x`` and ``y`` or to ``xs`` and ``ys``).
+    """
+    table = _TRUTH_TABLES[o] # Resolved once rather than on every invocation.
+    arity = 2 if len(table) == 4 else 1
+
+    # pylint: disable=protected-access
+    if owner == 'bit':
+        def unary(self: bit) -> bit:
+            return bit._unop(o, self, table)
+
+        def binary(self: bit, other: bit) -> bit:
+            return bit._binop(o, self, other, table)
+    else:
+        def unary(self: bits) -> bits:
+            return self._map_apply(o, table)
+
+        def binary(self: bits, other: bits) -> bits:
+            return self._zip_apply(other, o, table)
+
+    method = binary if arity == 2 else unary
+    method.__name__ = name
+    method.__qualname__ = owner + '.' + name
+
+    # Individual bits are demonstrated using one-element lists of arguments and
+    # bit vectors are demonstrated using three-element vectors.
+    (pattern, combinations) = (
+        ('(x, y)', '[(0, 0), (0, 1), (1, 0), (1, 1)]') if arity == 2 else ('x', '[0, 1]')
+    )
+    if owner == 'bit':
+        (subject, width, expression, setup) = (
+            'individual :obj:`bit` instances' if arity == 2 else 'an individual :obj:`bit` instance',
+            1, '[' + example + ']', ''
+        )
+    else:
+        (subject, width, expression) = ('bit vectors', 3, example)
+        setup = '\n        ...     ' + (
+            '(xs, ys) = (inputs([x, x, x]), inputs([y, y, y]))' if arity == 2 else
+            'xs = inputs([x, x, x])'
+        )
+    wire = '[' + ', '.join(v for v in ['x', 'y'][:arity] for _ in range(width)) + ']'
+    rows = '\n        '.join(str([v] * width) for v in table)
+    method.__doc__ = f"""
+        Logical operation for {subject}.
+
+        >>> results = []
+        >>> for {pattern} in {combinations}:
+        ...     bit.circuit(circuit()){setup}
+        ...     zs = outputs({expression})
+        ...     results.append([int(z) for z in zs] == bit.circuit().evaluate({wire}))
+        >>> all(results)
+        True
+
+        The results for each combination of argument values are as follows.
+
+        >>> for {pattern} in {combinations}:{setup}
+        ...     print([int(z) for z in {expression}])
+        {rows}
+        """
+    return method
+
 class bit:
     """
     Class for representing an abstract bit. Such a bit can be interpreted
@@ -57,7 +174,7 @@ class bit:
     >>> def make_hook_that_prints_created_gates(bit_):
     ...     def hook(o, v, *args):
     ...         print('created gate with operation "' + o.name() + '"')
-    ...         return bit_.constructor(*args)(v, bit_.gate(o, [a.gate for a in args]))
+    ...         return bit_.constructor(*args)(v, bit_.gate(o, tuple(a.gate for a in args)))
     ...     return hook
     >>> bit.hook_operation(make_hook_that_prints_created_gates(bit))
     >>> bit.circuit(circuit())
@@ -69,11 +186,23 @@ class bit:
     circuits are constructed.
 
     >>> bit.hook_operation()
+
+    Instances can be members of sets and keys of dictionaries; two instances
+    are treated as the same key only if they are the same object.
+
+    >>> (x, y) = (constant(1), constant(1))
+    >>> len({x: 0, y: 1, x: 2})
+    2
     """
     # pylint: disable=too-many-public-methods
+    __slots__ = ('value', '_gate')
 
     _circuit = None
     _hook_operation = None
+    _simplify = True
+    _compute_values = True
+    _is_output = False # Checked instead of ``isinstance(..., output)`` on hot paths.
+    _subexpressions = {}
 
     def __init__(
             self: bit,
@@ -84,10 +213,9 @@ class bit:
         Create an instance with the specified value and (if one is supplied)
         designate an associated gate object.
         """
+        c = bit._circuit
         self.value = value
-
-        if bit._circuit is not None:
-            self.gate = bit._circuit.gates if gate is None else gate
+        self._gate = None if c is None else c.gates if gate is None else gate
 
     @staticmethod
     def circuit(
@@ -112,17 +240,18 @@ class bit:
         >>> bit.circuit() is None
         True
         """
+        bit._subexpressions = {}
+
         if circuit is not None:
             bit._circuit = circuit
             return None
 
-        if bit._circuit is not None:
-            bit._circuit.prune_and_topological_sort_stable()
-            c = bit._circuit
+        c = bit._circuit
+        if c is not None:
+            c.prune_and_topological_sort_stable()
             bit._circuit = None
-            return c
 
-        return None
+        return c
 
     @staticmethod
     def hook_operation(hook: Optional[Callable] = None):
@@ -133,7 +262,7 @@ class bit:
         >>> def make_hook_that_prints_created_gates(bit_):
         ...     def hook(o, v, *args):
         ...         print('created gate with operation "' + o.name() + '"')
-        ...         return bit_.constructor(*args)(v, bit_.gate(o, [a.gate for a in args]))
+        ...         return bit_.constructor(*args)(v, bit_.gate(o, tuple(a.gate for a in args)))
         ...     return hook
         >>> bit.hook_operation(make_hook_that_prints_created_gates(bit))
         >>> bit.circuit(circuit())
@@ -143,6 +272,10 @@ class bit:
         >>> b.value == bit.circuit().evaluate([0, 0])[0]
         True
 
+        A hook sees every operation that is applied (including repeated
+        operations and double negations), and the gates it adds using
+        :obj:`bit.gate` are not simplified (see :obj:`bit.simplify`).
+
         If a hook function returns ``None``, then the default instance of :obj:`bit`
         is returned when an operation is applied.
 
@@ -160,6 +293,65 @@ class bit:
         """
         bit._hook_operation = hook
 
+    @staticmethod
+    def simplify(flag: bool = True):
+        """
+        Enable or disable simplifications that reduce the number of gates
+        introduced into a circuit under construction. By default, simplifications
+        are enabled and an operation is not introduced as a new gate if an
+        identical operation has already been applied to the same input gates
+        (*i.e.*, common subexpressions are eliminated). Simplifications are only
+        applied when no hook has been assigned using :obj:`bit.hook_operation`,
+        and identity operations (which are used to duplicate values) are never
+        merged.
+
+        >>> bit.circuit(circuit())
+        >>> (x, y) = (input(0), input(1))
+        >>> (b0, b1) = (x & y, x & y)
+        >>> b0.gate is b1.gate
+        True
+        >>> (b0, b1) = outputs([b0, b1])
+        >>> bit.circuit().count()
+        5
+
+        Simplifications can be disabled if every operation must correspond to
+        a distinct gate.
+
+        >>> bit.simplify(False)
+        >>> bit.circuit(circuit())
+        >>> (x, y) = (input(0), input(1))
+        >>> (b0, b1) = (x & y, x & y)
+        >>> b0.gate is b1.gate
+        False
+        >>> (b0, b1) = outputs([b0, b1])
+        >>> bit.circuit().count()
+        6
+        >>> bit.simplify()
+        """
+        bit._simplify = flag
+
+    @staticmethod
+    def values(flag: bool = True):
+        """
+        Enable or disable the computation of the values of the results of
+        operations. By default, values are computed. If a circuit is only being
+        constructed (and is evaluated later), value computation can be disabled.
+        In that case, the value of every result of an operation that is not
+        folded into a :obj:`constant` instance is ``0``.
+
+        >>> bit.values(False)
+        >>> bit.circuit(circuit())
+        >>> b = output(input(1) & input(1))
+        >>> b.value
+        0
+        >>> bit.circuit().evaluate([1, 1])
+        [1]
+        >>> bit.values()
+        >>> (input(1) & input(1)).value
+        1
+        """
+        bit._compute_values = flag
+
     @staticmethod
     def operation(o: Callable, *args) -> bit:
         """
@@ -186,21 +378,69 @@ class bit:
           ...
         TypeError: cannot supply an output as an argument to an operation
         >>> _ = bit.circuit() # Remove designated circuit.
+
+        If no hook has been assigned and the result of an operation is fully
+        determined by those of its arguments that are :obj:`constant` instances,
+        the operation is folded into a :obj:`constant` instance and no gate for
+        the operation is introduced.
+
+        >>> bit.circuit(circuit())
+        >>> b = bit.operation(op.and_, input(1), constant(0))
+        >>> isinstance(b, constant)
+        True
+        >>> b = output(bit.operation(op.xor_, b, constant(1)))
+        >>> c = bit.circuit()
+        >>> c.count()
+        3
+        >>> c.evaluate([0])
+        [1]
+
+        If no hook has been assigned, unary and binary operations that have
+        truth tables are delegated to the specialized :obj:`bit._unop` and
+        :obj:`bit._binop` methods.
+
+        >>> b = bit.operation(op.xor_, bit(1), 1)
+        >>> (type(b).__name__, b.value)
+        ('bit', 0)
+
+        Other operations are handled by the general case, which converts an
+        integer second argument into a :obj:`constant` instance and folds in the
+        same way (including operations that have no arguments).
+
+        >>> bit.circuit(circuit())
+        >>> b = output(bit.operation(op.fst_, input(1), 0))
+        >>> (b.value, bit.circuit().evaluate([1]))
+        (1, [1])
+        >>> b = bit.operation(op.snd_, input(1), constant(0))
+        >>> (type(b).__name__, b.value)
+        ('constant', 0)
+        >>> b = bit.operation(op.nt_)
+        >>> (type(b).__name__, b.value)
+        ('constant', 1)
+        >>> bit.operation(op.fst_, output(input(0)), input(1))
+        Traceback (most recent call last):
+          ...
+        TypeError: cannot supply an output as an argument to an operation
         """
+        if bit._hook_operation is None:
+            table = _TRUTH_TABLES.get(o)
+            if table is not None and len(table) == 1 << len(args):
+                return (bit._unop if len(args) == 1 else bit._binop)(o, *args, table)
+
         # Ensure second argument is a `bit`.
-        args = list(args)
-        if len(args) == 2:
-            args[1] = constant(args[1]) if isinstance(args[1], int) else args[1]
+        if len(args) == 2 and isinstance(args[1], int):
+            args = (args[0], constant(args[1]))
 
         # Ensure none of the arguments are outputs.
         for a in args:
-            if isinstance(a, output):
+            if a._is_output: # pylint: disable=protected-access
                 raise TypeError(
                     'cannot supply an output as an argument to an operation'
                 )
 
-        # Compute the value of the result of the operation on the arguments.
-        v = o(*[a.value for a in args])
+        # Compute the value of the result of the operation on the arguments
+        # (unless value computation is disabled).
+        v = o(*[a.value for a in args]) if bit._compute_values else 0
 
         # Return output from hook if it exists and if
         # it returns an output.
@@ -208,8 +448,138 @@ class bit:
             r = bit._hook_operation(o, v, *args) # pylint: disable=not-callable
             if r is not None:
                 return r
+        elif bit._folds(o, *args):
+            return constant(v if bit._compute_values else o(*[a.value for a in args]))
+
+        return bit.constructor(*args)(v, bit._simplified_gate(o, tuple(a.gate for a in args)))
+
+    @staticmethod
+    def _unop(o: Callable, a: bit, table: Optional[tuple] = None) -> bit:
+        """
+        Apply the supplied unary operation method to a :obj:`bit` argument. This
+        method has the same behavior as :obj:`bit.operation`, but it avoids the
+        overhead of the general case when no hook has been assigned. Callers that
+        apply the same operation repeatedly can supply its truth table to avoid
+        looking it up on every invocation.
+
+        >>> bit.circuit(circuit())
+        >>> b = output(bit._unop(op.not_, input(0)))
+        >>> b.value == bit.circuit().evaluate([0])[0]
+        True
+
+        As with :obj:`bit.operation`, an operation on a :obj:`constant` instance
+        is folded into a :obj:`constant` instance.
+
+        >>> b = bit._unop(op.not_, constant(1))
+        >>> (type(b).__name__, b.value)
+        ('constant', 0)
+        """
+        if bit._hook_operation is not None:
+            return bit.operation(o, a)
+
+        if a._is_output: # pylint: disable=protected-access
+            raise TypeError('cannot supply an output as an argument to an operation')
+
+        table = _TRUTH_TABLES[o] if table is None else table
+
+        if isinstance(a, constant):
+            return constant(table[a.value])
+
+        # Create the result without invoking the constructor.
+        r = object.__new__(bit)
+        r.value = table[a.value] if bit._compute_values else 0
+        r._gate = None if bit._circuit is None else bit._simplified_gate(o, (a._gate,)) # pylint: disable=protected-access
+        return r
+
+    @staticmethod
+    def _binop(
+            o: Callable, a: bit, b: Union[bit, int], table: Optional[tuple] = None
+        ) -> bit:
+        """
+        Apply the supplied binary operation method to two arguments (the second
+        of which may be an integer). This method has the same behavior as
+        :obj:`bit.operation`, but it avoids the overhead of the general case when
+        no hook has been assigned. As with :obj:`bit._unop`, the truth table of
+        the operation can be supplied by the caller.
+
+        >>> bit.circuit(circuit())
+        >>> b = output(bit._binop(op.and_, input(1), 1))
+        >>> b.value == bit.circuit().evaluate([1])[0]
+        True
+        >>> bit.circuit(circuit())
+        >>> b = bit._binop(op.and_, output(input(1)), input(1))
+        Traceback (most recent call last):
+          ...
+        TypeError: cannot supply an output as an argument to an operation
+        >>> _ = bit.circuit() # Remove designated circuit.
+        """
+        if bit._hook_operation is not None:
+            return bit.operation(o, a, b)
+
+        if isinstance(b, int):
+            b = constant(b)
+
+        if a._is_output or b._is_output: # pylint: disable=protected-access
+            raise TypeError('cannot supply an output as an argument to an operation')
+
+        table = _TRUTH_TABLES[o] if table is None else table
 
-        return bit.constructor(*args)(v, bit.gate(o, [a.gate for a in args]))
+        if (isinstance(a, constant) or isinstance(b, constant)) and bit._folds(o, a, b):
+            return constant(table[(a.value << 1) | b.value])
+
+        # Create the result without invoking the constructor.
+        r = object.__new__(bit)
+        r.value = table[(a.value << 1) | b.value] if bit._compute_values else 0
+        r._gate = None if bit._circuit is None else bit._simplified_gate(o, (a._gate, b._gate)) # pylint: disable=protected-access
+        return r
+
+    @staticmethod
+    def _folds(o: Callable, *args) -> bool:
+        """
+        Determine whether the result of applying the supplied operation to the
+        supplied arguments is fully determined by those arguments that are
+        :obj:`constant` instances. This is the case if all arguments are
+        constants, or if one argument of a binary operation is a constant that
+        determines the result on its own (such as ``0`` for conjunction).
+
+        >>> bit._folds(op.and_, constant(0), input(1))
+        True
+        >>> bit._folds(op.or_, input(1), constant(1))
+        True
+        >>> bit._folds(op.and_, input(1), constant(1))
+        False
+        >>> bit._folds(op.xor_, constant(1), constant(1))
+        True
+        """
+        if len(args) == 2:
+            (a, b) = args
+            if isinstance(a, constant):
+                return isinstance(b, constant) or o(a.value, 0) == o(a.value, 1)
+            return isinstance(b, constant) and o(0, b.value) == o(1, b.value)
+
+        return all(isinstance(a, constant) for a in args)
+
+    @classmethod
+    def _bulk(cls, values: Sequence[int], gates: Sequence[Optional[gate]]) -> list:
+        """
+        Create a list of instances of this class (one for each value and its
+        corresponding gate) without invoking the constructor of each instance.
+        This method is used by the :obj:`constants`, :obj:`inputs`, and
+        :obj:`outputs` functions.
+
+        >>> bs = constant._bulk([0, 1], [None, None])
+        >>> [(type(b).__name__, b.value) for b in bs]
+        [('constant', 0), ('constant', 1)]
+        """
+        new = object.__new__
+        instances = []
+        for (v, g) in zip(values, gates):
+            b = new(cls)
+            b.value = v
+            b._gate = g
+            instances.append(b)
+
+        return instances
 
     @staticmethod
     def constructor(
@@ -223,8 +593,8 @@ class bit:
         """
         return bit
 
-    @staticmethod
-    def gate(operation: op, igs: Sequence[gate]) -> Optional[gate]: # pylint: disable=method-hidden
+    @_gate_method
+    def gate(operation: op, igs: Sequence[gate]) -> Optional[gate]:
         """
         Add a gate to the designated circuit object that is under construction.
         This method is primarily provided to aid in the implementation of custom
@@ -237,71 +607,141 @@ class bit:
 
         >>> def make_hook(bit_):
         ...     def hook(o, v, *args):
-        ...         return bit_.constructor(*args)(v, bit_.gate(o, [a.gate for a in args]))
+        ...         return bit_.constructor(*args)(v, bit_.gate(o, tuple(a.gate for a in args)))
         ...     return hook
         >>> bit.hook_operation(make_hook(bit))
         >>> bit.circuit(circuit())
         >>> b = output(input(0).and_(input(0)))
         >>> b.value == bit.circuit().evaluate([0, 0])[0]
         True
-        """
-        return (
-            bit._circuit.gate(operation, igs)
-            if bit._circuit is not None else
-            None
-        )
+        >>> bit.hook_operation()
 
-    def __int__(self: bit) -> int:
-        """
-        Convert this :obj:`bit` instance into the integer representation of
-        its value.
+        Every invocation of this method adds a new gate to the circuit. The
+        simplifications that are applied when operations are invoked without a
+        hook (see :obj:`bit.simplify`) are not applied to the gates that a hook
+        adds using this method.
 
-        >>> int(bit(1))
-        1
+        >>> bit.hook_operation(make_hook(bit))
+        >>> bit.circuit(circuit())
+        >>> x = input(1)
+        >>> bs = outputs([x.not_().not_(), x & x, x & x])
+        >>> bit.circuit().count()
+        8
+        >>> bit.hook_operation()
         """
-        return self.value
+        c = bit._circuit
+        return None if c is None else c.gate(operation, igs)
 
-    def id_(self: bit) -> bit:
+    @staticmethod
+    def _simplified_gate(operation: op, igs: Sequence[gate]) -> Optional[gate]:
         """
-        Logical operation for an individual :obj:`bit` instance.
+        Add a gate to the designated circuit object that is under construction
+        (as with :obj:`bit.gate`) when an operation is applied without a hook.
+        Unless simplifications are disabled (see :obj:`bit.simplify`), a gate
+        that has already been added for the same operation and input gates is
+        returned instead of a new gate (including when the order of the input
+        gates of a symmetric operation such as conjunction is different).
+        Likewise, negating a gate that is itself a negation returns the input
+        gate of the latter.
 
-        >>> results = []
-        >>> for x in [0, 1]:
-        ...     bit.circuit(circuit())
-        ...     b = output(input(x).id_())
-        ...     results.append(int(b) == bit.circuit().evaluate([x])[0])
-        >>> all(results)
+        >>> bit.circuit(circuit())
+        >>> b = output(input(1).not_().not_())
+        >>> c = bit.circuit()
+        >>> c.count()
+        2
+        >>> c.evaluate([0])
+        [0]
+        >>> bit.circuit(circuit())
+        >>> (x, y) = (input(0), input(1))
+        >>> bs = outputs([x & y, y & x, x.imp_(y), y.imp_(x)])
+        >>> bit.circuit().count()
+        9
+
+        Identity gates are never merged because applying the identity operation
+        is the way to duplicate a value (*e.g.*, so that it can be designated as
+        an output more than once).
+
+        >>> bit.circuit(circuit())
+        >>> x = input(1)
+        >>> (b0, b1) = (x.id_(), x.id_())
+        >>> b0.gate is b1.gate
+        False
+        >>> _ = bit.circuit() # Remove designated circuit.
+        >>> bit._simplified_gate(op.id_, ()) is None
         True
         """
-        return bit.operation(op.id_, self)
+        c = bit._circuit
+        if c is None:
+            return None
+
+        if not bit._simplify or operation == op.id_:
+            return c.gate(operation, igs)
+
+        if operation == op.not_ and getattr(igs[0], 'operation', None) == op.not_:
+            return igs[0].inputs[0]
+
+        subexpressions = bit._subexpressions
+        key = (operation, *(sorted(map(id, igs)) if operation in _SYMMETRIC else map(id, igs)))
+        g = subexpressions.get(key)
+        if g is None:
+            g = subexpressions[key] = c.gate(operation, igs)
+
+        return g
 
-    def not_(self: bit) -> bit:
+    @staticmethod
+    def _gates(operation: op, igss: Sequence[Sequence[gate]]) -> list:
         """
-        Logical operation for an individual :obj:`bit` instance.
+        Add a gate for the supplied operation to the designated circuit for each
+        of the supplied sequences of input gates, with the same behavior as
+        :obj:`bit._simplified_gate` but reading the circuit and the subexpression table only
+        once.
 
-        >>> results = []
-        >>> for x in [0, 1]:
-        ...     bit.circuit(circuit())
-        ...     b = output(input(x).not_())
-        ...     results.append(int(b) == bit.circuit().evaluate([x])[0])
-        >>> all(results)
+        >>> bit.circuit(circuit())
+        >>> (x, y) = (input(0), input(1))
+        >>> gs = bit._gates(op.imp_, [(x.gate, y.gate), (y.gate, x.gate), (x.gate, y.gate)])
+        >>> (gs[0] is gs[2], gs[0] is gs[1])
+        (True, False)
+        >>> gs = bit._gates(op.and_, [(x.gate, y.gate), (y.gate, x.gate)])
+        >>> gs[0] is gs[1]
         True
+        >>> _ = bit.circuit() # Remove designated circuit.
+        >>> bit._gates(op.and_, [(None, None)])
+        [None]
         """
-        return bit.operation(op.not_, self)
+        c = bit._circuit
+        if c is None:
+            return [None] * len(igss)
 
-    def __invert__(self: bit) -> bit:
+        if not bit._simplify or operation in (op.not_, op.id_):
+            gate = bit._simplified_gate
+            return [gate(operation, igs) for igs in igss]
+
+        (add, subexpressions) = (c.gate, bit._subexpressions)
+        order = sorted if operation in _SYMMETRIC else iter
+        gs = []
+        for igs in igss:
+            key = (operation, *order(map(id, igs)))
+            g = subexpressions.get(key)
+            if g is None:
+                g = subexpressions[key] = add(operation, igs)
+            gs.append(g)
+
+        return gs
+
+    def __int__(self: bit) -> int:
         """
-        Logical operation for an individual :obj:`bit` instance.
+        Convert this :obj:`bit` instance into the integer representation of
+        its value.
 
-        >>> results = []
-        >>> for x in [0, 1]:
-        ...     bit.circuit(circuit())
-        ...     b = output(~input(x))
-        ...     results.append(int(b) == bit.circuit().evaluate([x])[0])
-        >>> all(results)
-        True
+        >>> int(bit(1))
+        1
         """
-        return bit.operation(op.not_, self)
+        return self.value
+
+    id_ = _operation_method('bit', 'id_', op.id_, 'input(x).id_()')
+
+    not_ = _operation_method('bit', 'not_', op.not_, 'input(x).not_()')
+    __invert__ = _operation_method('bit', '__invert__', op.not_, '~input(x)')
 
     def __rsub__(self: bit, other: bit) -> bit:
         """
@@ -325,36 +765,11 @@ class bit:
         ValueError: can only subtract a bit from the integer 1
         """
         if other == 1:
-            return bit.operation(op.not_, self)
+            return bit._unop(op.not_, self)
         raise ValueError('can only subtract a bit from the integer 1')
 
-    def and_(self: bit, other: bit) -> bit:
-        """
-        Logical operation for individual :obj:`bit` instances.
-
-        >>> results = []
-        >>> for (x, y) in [(0, 0), (0, 1), (1, 0), (1, 1)]:
-        ...     bit.circuit(circuit())
-        ...     b = output(input(x).and_(input(y)))
-        ...     results.append(int(b) == bit.circuit().evaluate([x, y])[0])
-        >>> all(results)
-        True
-        """
-        return bit.operation(op.and_, self, other)
-
-    def __and__(self: bit, other: bit) -> bit:
-        """
-        Logical operation for individual :obj:`bit` instances.
-
-        >>> results = []
-        >>> for (x, y) in [(0, 0), (0, 1), (1, 0), (1, 1)]:
-        ...     bit.circuit(circuit())
-        ...     b = output(input(x) & input(y))
-        ...     results.append(int(b) == bit.circuit().evaluate([x, y])[0])
-        >>> all(results)
-        True
-        """
-        return bit.operation(op.and_, self, other)
+    and_ = _operation_method('bit', 'and_', op.and_, 'input(x).and_(input(y))')
+    __and__ = _operation_method('bit', '__and__', op.and_, 'input(x) & input(y)')
 
     def __rand__(self: bit, other: bit) -> bit:
         """
@@ -366,379 +781,67 @@ class bit:
         """
         return self & (constant(other) if isinstance(other, int) else other)
 
-    def nimp(self: bit, other: bit) -> bit:
-        """
-        Logical operation for individual :obj:`bit` instances.
-
-        >>> results = []
-        >>> for (x, y) in [(0, 0), (0, 1), (1, 0), (1, 1)]:
-        ...     bit.circuit(circuit())
-        ...     b = output(input(x).nimp(input(y)))
-        ...     results.append(int(b) == bit.circuit().evaluate([x, y])[0])
-        >>> all(results)
-        True
-        """
-        return bit.operation(op.nimp_, self, other)
+    nimp = _operation_method('bit', 'nimp', op.nimp_, 'input(x).nimp(input(y))')
+    nimp_ = _operation_method('bit', 'nimp_', op.nimp_, 'input(x).nimp_(input(y))')
+    __gt__ = _operation_method('bit', '__gt__', op.nimp_, 'input(x) > input(y)')
 
-    def nimp_(self: bit, other: bit) -> bit:
-        """
-        Logical operation for individual :obj:`bit` instances.
+    nif = _operation_method('bit', 'nif', op.nif_, 'input(x).nif(input(y))')
+    nif_ = _operation_method('bit', 'nif_', op.nif_, 'input(x).nif_(input(y))')
+    __lt__ = _operation_method('bit', '__lt__', op.nif_, 'input(x) < input(y)')
 
-        >>> results = []
-        >>> for (x, y) in [(0, 0), (0, 1), (1, 0), (1, 1)]:
-        ...     bit.circuit(circuit())
-        ...     b = output(input(x).nimp_(input(y)))
-        ...     results.append(int(b) == bit.circuit().evaluate([x, y])[0])
-        >>> all(results)
-        True
-        """
-        return bit.operation(op.nimp_, self, other)
+    xor = _operation_method('bit', 'xor', op.xor_, 'input(x).xor(input(y))')
+    xor_ = _operation_method('bit', 'xor_', op.xor_, 'input(x).xor_(input(y))')
+    __xor__ = _operation_method('bit', '__xor__', op.xor_, 'input(x) ^ input(y)')
 
-    def __gt__(self: bit, other: bit) -> bit:
+    def __rxor__(self: bit, other: bit) -> bit:
         """
         Logical operation for individual :obj:`bit` instances.
 
-        >>> results = []
-        >>> for (x, y) in [(0, 0), (0, 1), (1, 0), (1, 1)]:
-        ...     bit.circuit(circuit())
-        ...     b = output(input(x) > input(y))
-        ...     results.append(int(b) == bit.circuit().evaluate([x, y])[0])
-        >>> all(results)
-        True
-        """
-        return self.nimp(other)
-
-    def nif(self: bit, other: bit) -> bit:
+        >>> b =  1 ^ constant(0)
+        >>> b.value
+        1
         """
-        Logical operation for individual :obj:`bit` instances.
+        return self ^ (constant(other) if isinstance(other, int) else other)
 
-        >>> results = []
-        >>> for (x, y) in [(0, 0), (0, 1), (1, 0), (1, 1)]:
-        ...     bit.circuit(circuit())
-        ...     b = output(input(x).nif(input(y)))
-        ...     results.append(int(b) == bit.circuit().evaluate([x, y])[0])
-        >>> all(results)
-        True
-        """
-        return bit.operation(op.nif_, self, other)
+    or_ = _operation_method('bit', 'or_', op.or_, 'input(x).or_(input(y))')
+    __or__ = _operation_method('bit', '__or__', op.or_, 'input(x) | input(y)')
 
-    def nif_(self: bit, other: bit) -> bit:
+    def __ror__(self: bit, other: bit) -> bit:
         """
         Logical operation for individual :obj:`bit` instances.
 
-        >>> results = []
-        >>> for (x, y) in [(0, 0), (0, 1), (1, 0), (1, 1)]:
-        ...     bit.circuit(circuit())
-        ...     b = output(input(x).nif_(input(y)))
-        ...     results.append(int(b) == bit.circuit().evaluate([x, y])[0])
-        >>> all(results)
-        True
+        >>> b = 1 | constant(0)
+        >>> b.value
+        1
         """
-        return bit.operation(op.nif_, self, other)
+        return self | (constant(other) if isinstance(other, int) else other)
 
-    def __lt__(self: bit, other: bit) -> bit:
-        """
-        Logical operation for individual :obj:`bit` instances.
+    nor = _operation_method('bit', 'nor', op.nor_, 'input(x).nor(input(y))')
+    nor_ = _operation_method('bit', 'nor_', op.nor_, 'input(x).nor_(input(y))')
+    __mod__ = _operation_method('bit', '__mod__', op.nor_, 'input(x) % input(y)')
 
-        >>> results = []
-        >>> for (x, y) in [(0, 0), (0, 1), (1, 0), (1, 1)]:
-        ...     bit.circuit(circuit())
-        ...     b = output(input(x) < input(y))
-        ...     results.append(int(b) == bit.circuit().evaluate([x, y])[0])
-        >>> all(results)
-        True
-        """
-        return self.nif(other)
+    xnor = _operation_method('bit', 'xnor', op.xnor_, 'input(x).xnor(input(y))')
+    xnor_ = _operation_method('bit', 'xnor_', op.xnor_, 'input(x).xnor_(input(y))')
+    __eq__ = _operation_method('bit', '__eq__', op.xnor_, 'input(x) == input(y)')
 
-    def xor(self: bit, other: bit) -> bit:
-        """
-        Logical operation for individual :obj:`bit` instances.
+    # Instances are hashed by identity (as ``__eq__`` introduces a gate rather
+    # than comparing instances) so that they can be used as dictionary keys.
+    __hash__ = object.__hash__
 
-        >>> results = []
-        >>> for (x, y) in [(0, 0), (0, 1), (1, 0), (1, 1)]:
-        ...     bit.circuit(circuit())
-        ...     b = output(input(x).xor(input(y)))
-        ...     results.append(int(b) == bit.circuit().evaluate([x, y])[0])
-        >>> all(results)
-        True
-        """
-        return bit.operation(op.xor_, self, other)
+    if_ = _operation_method('bit', 'if_', op.if_, 'input(x).if_(input(y))')
+    __ge__ = _operation_method('bit', '__ge__', op.if_, 'input(x) >= input(y)')
 
-    def xor_(self: bit, other: bit) -> bit:
-        """
-        Logical operation for individual :obj:`bit` instances.
+    imp = _operation_method('bit', 'imp', op.imp_, 'input(x).imp(input(y))')
+    imp_ = _operation_method('bit', 'imp_', op.imp_, 'input(x).imp_(input(y))')
+    __le__ = _operation_method('bit', '__le__', op.imp_, 'input(x) <= input(y)')
 
-        >>> results = []
-        >>> for (x, y) in [(0, 0), (0, 1), (1, 0), (1, 1)]:
-        ...     bit.circuit(circuit())
-        ...     b = output(input(x).xor_(input(y)))
-        ...     results.append(int(b) == bit.circuit().evaluate([x, y])[0])
-        >>> all(results)
-        True
-        """
-        return bit.operation(op.xor_, self, other)
+    nand = _operation_method('bit', 'nand', op.nand_, 'input(x).nand(input(y))')
+    nand_ = _operation_method('bit', 'nand_', op.nand_, 'input(x).nand_(input(y))')
+    __matmul__ = _operation_method('bit', '__matmul__', op.nand_, 'input(x) @ input(y)')
 
-    def __xor__(self: bit, other: bit) -> bit:
-        """
-        Logical operation for individual :obj:`bit` instances.
-
-        >>> results = []
-        >>> for (x, y) in [(0, 0), (0, 1), (1, 0), (1, 1)]:
-        ...     bit.circuit(circuit())
-        ...     b = output(input(x) ^ input(y))
-        ...     results.append(int(b) == bit.circuit().evaluate([x, y])[0])
-        >>> all(results)
-        True
-        """
-        return bit.operation(op.xor_, self, other)
-
-    def __rxor__(self: bit, other: bit) -> bit:
-        """
-        Logical operation for individual :obj:`bit` instances.
-
-        >>> b =  1 ^ constant(0)
-        >>> b.value
-        1
-        """
-        return self ^ (constant(other) if isinstance(other, int) else other)
-
-    def or_(self: bit, other: bit) -> bit:
-        """
-        Logical operation for individual :obj:`bit` instances.
-
-        >>> results = []
-        >>> for (x, y) in [(0, 0), (0, 1), (1, 0), (1, 1)]:
-        ...     bit.circuit(circuit())
-        ...     b = output(input(x).or_(input(y)))
-        ...     results.append(int(b) == bit.circuit().evaluate([x, y])[0])
-        >>> all(results)
-        True
-        """
-        return bit.operation(op.or_, self, other)
-
-    def __or__(self: bit, other: bit) -> bit:
-        """
-        Logical operation for individual :obj:`bit` instances.
-
-        >>> results = []
-        >>> for (x, y) in [(0, 0), (0, 1), (1, 0), (1, 1)]:
-        ...     bit.circuit(circuit())
-        ...     b = output(input(x) | input(y))
-        ...     results.append(int(b) == bit.circuit().evaluate([x, y])[0])
-        >>> all(results)
-        True
-        """
-        return bit.operation(op.or_, self, other)
-
-    def __ror__(self: bit, other: bit) -> bit:
-        """
-        Logical operation for individual :obj:`bit` instances.
-
-        >>> b = 1 | constant(0)
-        >>> b.value
-        1
-        """
-        return self | (constant(other) if isinstance(other, int) else other)
-
-    def nor(self: bit, other: bit) -> bit:
-        """
-        Logical operation for individual :obj:`bit` instances.
-
-        >>> results = []
-        >>> for (x, y) in [(0, 0), (0, 1), (1, 0), (1, 1)]:
-        ...     bit.circuit(circuit())
-        ...     b = output(input(x).nor(input(y)))
-        ...     results.append(int(b) == bit.circuit().evaluate([x, y])[0])
-        >>> all(results)
-        True
-        """
-        return bit.operation(op.nor_, self, other)
-
-    def nor_(self: bit, other: bit) -> bit:
-        """
-        Logical operation for individual :obj:`bit` instances.
-
-        >>> results = []
-        >>> for (x, y) in [(0, 0), (0, 1), (1, 0), (1, 1)]:
-        ...     bit.circuit(circuit())
-        ...     b = output(input(x).nor_(input(y)))
-        ...     results.append(int(b) == bit.circuit().evaluate([x, y])[0])
-        >>> all(results)
-        True
-        """
-        return bit.operation(op.nor_, self, other)
-
-    def __mod__(self: bit, other: bit) -> bit:
-        """
-        Logical operation for individual :obj:`bit` instances.
-
-        >>> results = []
-        >>> for (x, y) in [(0, 0), (0, 1), (1, 0), (1, 1)]:
-        ...     bit.circuit(circuit())
-        ...     b = output(input(x) % input(y))
-        ...     results.append(int(b) == bit.circuit().evaluate([x, y])[0])
-        >>> all(results)
-        True
-        """
-        return bit.operation(op.nor_, self, other)
-
-    def xnor(self: bit, other: bit) -> bit:
-        """
-        Logical operation for individual :obj:`bit` instances.
-
-        >>> results = []
-        >>> for (x, y) in [(0, 0), (0, 1), (1, 0), (1, 1)]:
-        ...     bit.circuit(circuit())
-        ...     b = output(input(x).xnor(input(y)))
-        ...     results.append(int(b) == bit.circuit().evaluate([x, y])[0])
-        >>> all(results)
-        True
-        """
-        return bit.operation(op.xnor_, self, other)
-
-    def xnor_(self: bit, other: bit) -> bit:
-        """
-        Logical operation for individual :obj:`bit` instances.
-
-        >>> results = []
-        >>> for (x, y) in [(0, 0), (0, 1), (1, 0), (1, 1)]:
-        ...     bit.circuit(circuit())
-        ...     b = output(input(x).xnor_(input(y)))
-        ...     results.append(int(b) == bit.circuit().evaluate([x, y])[0])
-        >>> all(results)
-        True
-        """
-        return bit.operation(op.xnor_, self, other)
-
-    def __eq__(self: bit, other: bit) -> bit:
-        """
-        Logical operation for individual :obj:`bit` instances.
-
-        >>> results = []
-        >>> for (x, y) in [(0, 0), (0, 1), (1, 0), (1, 1)]:
-        ...     bit.circuit(circuit())
-        ...     b = output(input(x) == input(y))
-        ...     results.append(int(b) == bit.circuit().evaluate([x, y])[0])
-        >>> all(results)
-        True
-        """
-        return bit.operation(op.xnor_, self, other)
-
-    def if_(self: bit, other: bit) -> bit:
-        """
-        Logical operation for individual :obj:`bit` instances.
-
-        >>> results = []
-        >>> for (x, y) in [(0, 0), (0, 1), (1, 0), (1, 1)]:
-        ...     bit.circuit(circuit())
-        ...     b = output(input(x).if_(input(y)))
-        ...     results.append(int(b) == bit.circuit().evaluate([x, y])[0])
-        >>> all(results)
-        True
-        """
-        return bit.operation(op.if_, self, other)
-
-    def __ge__(self: bit, other: bit) -> bit:
-        """
-        Logical operation for individual :obj:`bit` instances.
-
-        >>> results = []
-        >>> for (x, y) in [(0, 0), (0, 1), (1, 0), (1, 1)]:
-        ...     bit.circuit(circuit())
-        ...     b = output(input(x) >= input(y))
-        ...     results.append(int(b) == bit.circuit().evaluate([x, y])[0])
-        >>> all(results)
-        True
-        """
-        return bit.operation(op.if_, self, other)
-
-    def imp(self: bit, other: bit) -> bit:
-        """
-        Logical operation for individual :obj:`bit` instances.
-
-        >>> results = []
-        >>> for (x, y) in [(0, 0), (0, 1), (1, 0), (1, 1)]:
-        ...     bit.circuit(circuit())
-        ...     b = output(input(x).imp(input(y)))
-        ...     results.append(int(b) == bit.circuit().evaluate([x, y])[0])
-        >>> all(results)
-        True
-        """
-        return bit.operation(op.imp_, self, other)
-
-    def imp_(self: bit, other: bit) -> bit:
-        """
-        Logical operation for individual :obj:`bit` instances.
-
-        >>> results = []
-        >>> for (x, y) in [(0, 0), (0, 1), (1, 0), (1, 1)]:
-        ...     bit.circuit(circuit())
-        ...     b = output(input(x).imp_(input(y)))
-        ...     results.append(int(b) == bit.circuit().evaluate([x, y])[0])
-        >>> all(results)
-        True
-        """
-        return bit.operation(op.imp_, self, other)
-
-    def __le__(self: bit, other: bit) -> bit:
-        """
-        Logical operation for individual :obj:`bit` instances.
-
-        >>> results = []
-        >>> for (x, y) in [(0, 0), (0, 1), (1, 0), (1, 1)]:
-        ...     bit.circuit(circuit())
-        ...     b = output(input(x) <= input(y))
-        ...     results.append(int(b) == bit.circuit().evaluate([x, y])[0])
-        >>> all(results)
-        True
-        """
-        return bit.operation(op.imp_, self, other)
-
-    def nand(self: bit, other: bit) -> bit:
-        """
-        Logical operation for individual :obj:`bit` instances.
-
-        >>> results = []
-        >>> for (x, y) in [(0, 0), (0, 1), (1, 0), (1, 1)]:
-        ...     bit.circuit(circuit())
-        ...     b = output(input(x).nand(input(y)))
-        ...     results.append(int(b) == bit.circuit().evaluate([x, y])[0])
-        >>> all(results)
-        True
-        """
-        return bit.operation(op.nand_, self, other)
-
-    def nand_(self: bit, other: bit) -> bit:
-        """
-        Logical operation for individual :obj:`bit` instances.
-
-        >>> results = []
-        >>> for (x, y) in [(0, 0), (0, 1), (1, 0), (1, 1)]:
-        ...     bit.circuit(circuit())
-        ...     b = output(input(x).nand_(input(y)))
-        ...     results.append(int(b) == bit.circuit().evaluate([x, y])[0])
-        >>> all(results)
-        True
-        """
-        return bit.operation(op.nand_, self, other)
-
-    def __matmul__(self: bit, other: bit) -> bit:
-        """
-        Logical operation for individual :obj:`bit` instances.
-
-        >>> results = []
-        >>> for (x, y) in [(0, 0), (0, 1), (1, 0), (1, 1)]:
-        ...     bit.circuit(circuit())
-        ...     b = output(input(x) @ input(y))
-        ...     results.append(int(b) == bit.circuit().evaluate([x, y])[0])
-        >>> all(results)
-        True
-        """
-        return bit.operation(op.nand_, self, other)
-
-class constant(bit):
-    """
-    Instance of a :obj:`bit` that is designated as a constant value.
+class constant(bit):
+    """
+    Instance of a :obj:`bit` that is designated as a constant value.
 
     >>> constant(1).value
     1
@@ -754,17 +857,22 @@ class constant(bit):
     2
     >>> c.evaluate([])
     [0]
+
+    Unless simplifications are disabled (see :obj:`bit.simplify`), all
+    :obj:`constant` instances that have the same value share a single gate.
+
+    >>> bit.circuit(circuit())
+    >>> constant(0).gate is constant(0).gate
+    True
+    >>> _ = bit.circuit() # Remove designated circuit.
     """
+    __slots__ = ()
+
     def __init__(self: bit, value: int):
         """
         Instantiate an instance that is designated as a constant input.
         """
-        super().__init__(value)
-
-        self.value = value
-
-        if bit._circuit is not None:
-            self.gate = bit._circuit.gate(op.nf_ if self.value == 0 else op.nt_)
+        super().__init__(value, bit._simplified_gate(op.nf_ if value == 0 else op.nt_, ()))
 
 class input(bit): # pylint: disable=redefined-builtin
     """
@@ -777,26 +885,26 @@ class input(bit): # pylint: disable=redefined-builtin
     >>> b0.value
     0
     """
+    __slots__ = ()
+
     def __init__(self: bit, value: int):
         """
         Instantiate an instance that is designated as a variable input.
         """
-        super().__init__(value)
-
-        self.value = value
-
-        if bit._circuit is not None:
-            self.gate = bit._circuit.gate(op.id_, is_input=True)
+        c = bit._circuit
+        super().__init__(value, None if c is None else c.gate(op.id_, is_input=True))
 
 class input_one(input):
     """
     Instance of a :obj:`bit` that is designated as a variable input from one source.
     """
+    __slots__ = ()
 
 class input_two(input):
     """
     Instance of a :obj:`bit` that is designated as a variable input from a second source
     """
+    __slots__ = ()
 
 class output(bit):
     """
@@ -836,17 +944,31 @@ class output(bit):
     [0, 0, 1]
     >>> bit.circuit().evaluate([0])
     [1, 0]
+
+    Exactly one gate is introduced for each :obj:`output` instance (even when
+    the supplied :obj:`bit` instance is also used elsewhere).
+
+    >>> bit.circuit(circuit())
+    >>> b0 = input(1)
+    >>> b1 = output(b0)
+    >>> b2 = output(b0.not_())
+    >>> bit.circuit().count()
+    4
     """
+    __slots__ = ()
+    _is_output = True
+
     def __init__(self: bit, b: bit):
         """
-        Instantiate a bit that is designated as an output.
+        Instantiate a bit that is designated as an output. The gate of this
+        instance is a single identity gate (marked as an output gate) that
+        copies the value of the supplied :obj:`bit` instance.
         """
-        super().__init__(b)
-
-        self.value = b.value
-
-        if bit._circuit is not None:
-            self.gate = bit._circuit.gate(op.id_, [b.gate], is_output=True)
+        c = bit._circuit
+        super().__init__(
+            b.value,
+            None if c is None else c.gate(op.id_, (b.gate,), is_output=True)
+        )
 
 class bits_type(int): # pylint: disable=R0903
     """
@@ -861,573 +983,464 @@ class bits_type(int): # pylint: disable=R0903
         construction of this instance.
 
         >>> str(bits_type(32))
-        'bits(32)'
-        """
-        return 'bits(' + str(int(self)) + ')'
-
-    def __repr__(self):
-        """
-        Return representation that reflects the meaning and the manner of
-        construction of this instance.
-
-        >>> bits_type(32)
-        bits(32)
-        """
-        return 'bits(' + str(int(self)) + ')'
-
-class bits(list):
-    """
-    Class for representing a *bit vector* (*i.e.*, a list of abstract :obj:`bit`
-    instances).
-
-    >>> bs = bits([constant(1)] * 3)
-    >>> [b.value for b in bs]
-    [1, 1, 1]
-    """
-    # pylint: disable=too-many-public-methods
-
-    def __new__(cls, argument=None) -> bits:
-        """
-        Instantiate bit vector object given the supplied argument.
-        """
-        return (
-            bits_type(argument)
-            if isinstance(argument, int) else
-            list.__new__(cls, argument)
-        )
-
-    @staticmethod
-    def from_byte(b: int, constructor=bit) -> bits:
-        """
-        Convert an integer representing a single byte into a corresponding bit
-        vector.
-
-        >>> [b.value for b in bits.from_byte(255)]
-        [1, 1, 1, 1, 1, 1, 1, 1]
-        """
-        return bits([
-            constructor(bit_)
-            for bit_ in reversed([(b >> i) % 2 for i in range(8)])
-        ])
-
-    @staticmethod
-    def from_bytes(bs: Union[bytes, bytearray], constructor=bit) -> bits:
-        """
-        Convert a vector of bytes into a corresponding bit vector.
-
-        >>> [b.value for b in bits.from_bytes(bytes([255]))]
-        [1, 1, 1, 1, 1, 1, 1, 1]
-        >>> [b.value for b in bits.from_bytes(bytes([11, 0]))]
-        [0, 0, 0, 0, 1, 0, 1, 1, 0, 0, 0, 0, 0, 0, 0, 0]
-        """
-        return bits([
-            bit_
-            for byte_ in bs
-            for bit_ in bits.from_byte(byte_, constructor)
-        ])
-
-    @staticmethod
-    def zeros(n: int) -> bits:
-        """
-        Create a vector (of the specified length) of constant zero bits.
-
-        >>> bit.circuit(circuit())
-        >>> xs = bits.zeros(3)
-        >>> ys = outputs(xs.not_())
-        >>> [y.value for y in ys]
-        [1, 1, 1]
-        >>> _ = bit.circuit() # Remove designated circuit.
-        """
-        return bits([constant(0)]*n)
-
-    def __int__(self: bits) -> int:
-        """
-        Convert a bit vector into an integer.
-
-        >>> bit.circuit(circuit())
-        >>> xs = constants([0, 0, 0])
-        >>> ys = outputs(xs.not_())
-        >>> int(ys)
-        7
-        >>> _ = bit.circuit() # Remove designated circuit.
-        """
-        return sum(int(b)*(2**i) for (i, b) in zip(range(len(self)), reversed(self)))
-
-    def not_(self: bits) -> bits:
-        """
-        Logical operation for bit vectors.
-
-        >>> results = []
-        >>> for x in [0, 1]:
-        ...     bit.circuit(circuit())
-        ...     xs = inputs([x, x, x])
-        ...     ys = outputs(xs.not_())
-        ...     ns = [int(y) for y in ys]
-        ...     c = bit.circuit()
-        ...     results.append(ns == c.evaluate([x, x, x]))
-        >>> all(results)
-        True
-        """
-        return bits([x.not_() for x in self])
-
-    def __invert__(self: bits) -> bits:
-        """
-        Logical operation for bit vectors.
-
-        >>> results = []
-        >>> for x in [0, 1]:
-        ...     bit.circuit(circuit())
-        ...     xs = inputs([x, x, x])
-        ...     ys = outputs(~xs)
-        ...     ns = [int(y) for y in ys]
-        ...     c = bit.circuit()
-        ...     results.append(ns == c.evaluate([x, x, x]))
-        >>> all(results)
-        True
-        """
-        return bits([x.not_() for x in self])
-
-    def and_(self: bits, other: bits) -> bits:
-        """
-        Logical operation for bit vectors.
-
-        >>> results = []
-        >>> for (x, y) in [(0, 0), (0, 1), (1, 0), (1, 1)]:
-        ...     bit.circuit(circuit())
-        ...     (xs, ys) = (inputs([x, x, x]), inputs([y, y, y]))
-        ...     zs = outputs(xs.and_(ys))
-        ...     ns = [int(z) for z in zs]
-        ...     c = bit.circuit()
-        ...     results.append(ns == c.evaluate([x, x, x, y, y, y]))
-        >>> all(results)
-        True
-        """
-        return bits([x.and_(y) for (x, y) in zip(self, other)])
-
-    def __and__(self: bits, other: bits) -> bits:
-        """
-        Logical operation for bit vectors.
-
-        >>> results = []
-        >>> for (x, y) in [(0, 0), (0, 1), (1, 0), (1, 1)]:
-        ...     bit.circuit(circuit())
-        ...     (xs, ys) = (inputs([x, x, x]), inputs([y, y, y]))
-        ...     zs = outputs(xs & ys)
-        ...     ns = [int(z) for z in zs]
-        ...     c = bit.circuit()
-        ...     results.append(ns == c.evaluate([x, x, x, y, y, y]))
-        >>> all(results)
-        True
-        """
-        return bits([x.and_(y) for (x, y) in zip(self, other)])
-
-    def nimp(self: bits, other: bits) -> bits:
-        """
-        Logical operation for bit vectors.
-
-        >>> results = []
-        >>> for (x, y) in [(0, 0), (0, 1), (1, 0), (1, 1)]:
-        ...     bit.circuit(circuit())
-        ...     (xs, ys) = (inputs([x, x, x]), inputs([y, y, y]))
-        ...     zs = outputs(xs.nimp(ys))
-        ...     ns = [int(z) for z in zs]
-        ...     c = bit.circuit()
-        ...     results.append(ns == c.evaluate([x, x, x, y, y, y]))
-        >>> all(results)
-        True
-        """
-        return bits([x.nimp_(y) for (x, y) in zip(self, other)])
-
-    def nimp_(self: bits, other: bits) -> bits:
-        """
-        Logical operation for bit vectors.
-
-        >>> results = []
-        >>> for (x, y) in [(0, 0), (0, 1), (1, 0), (1, 1)]:
-        ...     bit.circuit(circuit())
-        ...     (xs, ys) = (inputs([x, x, x]), inputs([y, y, y]))
-        ...     zs = outputs(xs.nimp_(ys))
-        ...     ns = [int(z) for z in zs]
-        ...     c = bit.circuit()
-        ...     results.append(ns == c.evaluate([x, x, x, y, y, y]))
-        >>> all(results)
-        True
+        'bits(32)'
         """
-        return bits([x.nimp_(y) for (x, y) in zip(self, other)])
+        return 'bits(' + str(int(self)) + ')'
 
-    def __gt__(self: bits, other: bits) -> bits:
+    def __repr__(self):
         """
-        Logical operation for bit vectors.
+        Return representation that reflects the meaning and the manner of
+        construction of this instance.
 
-        >>> results = []
-        >>> for (x, y) in [(0, 0), (0, 1), (1, 0), (1, 1)]:
-        ...     bit.circuit(circuit())
-        ...     (xs, ys) = (inputs([x, x, x]), inputs([y, y, y]))
-        ...     zs = outputs(xs > ys)
-        ...     ns = [int(z) for z in zs]
-        ...     c = bit.circuit()
-        ...     results.append(ns == c.evaluate([x, x, x, y, y, y]))
-        >>> all(results)
-        True
+        >>> bits_type(32)
+        bits(32)
         """
-        return bits([x.nimp_(y) for (x, y) in zip(self, other)])
+        return 'bits(' + str(int(self)) + ')'
 
-    def nif(self: bits, other: bits) -> bits:
-        """
-        Logical operation for bit vectors.
+# Table that maps every byte value to the tuple of its bits (with the most
+# significant bit first).
+_BYTE_BITS = tuple(
+    tuple((b >> i) & 1 for i in (7, 6, 5, 4, 3, 2, 1, 0))
+    for b in range(256)
+)
 
-        >>> results = []
-        >>> for (x, y) in [(0, 0), (0, 1), (1, 0), (1, 1)]:
-        ...     bit.circuit(circuit())
-        ...     (xs, ys) = (inputs([x, x, x]), inputs([y, y, y]))
-        ...     zs = outputs(xs.nif(ys))
-        ...     ns = [int(z) for z in zs]
-        ...     c = bit.circuit()
-        ...     results.append(ns == c.evaluate([x, x, x, y, y, y]))
-        >>> all(results)
-        True
-        """
-        return bits([x.nif_(y) for (x, y) in zip(self, other)])
+class bits(list):
+    """
+    Class for representing a *bit vector* (*i.e.*, a list of abstract :obj:`bit`
+    instances).
 
-    def nif_(self: bits, other: bits) -> bits:
-        """
-        Logical operation for bit vectors.
+    >>> bs = bits([constant(1)] * 3)
+    >>> [b.value for b in bs]
+    [1, 1, 1]
+    """
+    # pylint: disable=too-many-public-methods
 
-        >>> results = []
-        >>> for (x, y) in [(0, 0), (0, 1), (1, 0), (1, 1)]:
-        ...     bit.circuit(circuit())
-        ...     (xs, ys) = (inputs([x, x, x]), inputs([y, y, y]))
-        ...     zs = outputs(xs.nif_(ys))
-        ...     ns = [int(z) for z in zs]
-        ...     c = bit.circuit()
-        ...     results.append(ns == c.evaluate([x, x, x, y, y, y]))
-        >>> all(results)
-        True
+    def __new__(cls, argument=None) -> bits:
         """
-        return bits([x.nif_(y) for (x, y) in zip(self, other)])
+        Instantiate bit vector object given the supplied argument. If the
+        argument is an integer, a type annotation is returned instead.
 
-    def __lt__(self: bits, other: bits) -> bits:
-        """
-        Logical operation for bit vectors.
+        >>> bits(8)
+        bits(8)
+        >>> bits()
+        []
 
-        >>> results = []
-        >>> for (x, y) in [(0, 0), (0, 1), (1, 0), (1, 1)]:
-        ...     bit.circuit(circuit())
-        ...     (xs, ys) = (inputs([x, x, x]), inputs([y, y, y]))
-        ...     zs = outputs(xs < ys)
-        ...     ns = [int(z) for z in zs]
-        ...     c = bit.circuit()
-        ...     results.append(ns == c.evaluate([x, x, x, y, y, y]))
-        >>> all(results)
-        True
+        The new instance is empty; it is populated (in a single pass over the
+        supplied iterable) by the inherited :obj:`list` initializer.
         """
-        return bits([x.nif_(y) for (x, y) in zip(self, other)])
+        return (
+            bits_type(argument)
+            if isinstance(argument, int) else
+            list.__new__(cls)
+        )
 
-    def xor(self: bits, other: bits) -> bits:
+    @staticmethod
+    def from_byte(b: int, constructor=bit) -> bits:
         """
-        Logical operation for bit vectors.
+        Convert an integer representing a single byte into a corresponding bit
+        vector.
 
-        >>> results = []
-        >>> for (x, y) in [(0, 0), (0, 1), (1, 0), (1, 1)]:
-        ...     bit.circuit(circuit())
-        ...     (xs, ys) = (inputs([x, x, x]), inputs([y, y, y]))
-        ...     zs = outputs(xs.xor(ys))
-        ...     ns = [int(z) for z in zs]
-        ...     c = bit.circuit()
-        ...     results.append(ns == c.evaluate([x, x, x, y, y, y]))
-        >>> all(results)
-        True
-        """
-        return bits([x.xor_(y) for (x, y) in zip(self, other)])
+        >>> [b.value for b in bits.from_byte(255)]
+        [1, 1, 1, 1, 1, 1, 1, 1]
 
-    def xor_(self: bits, other: bits) -> bits:
-        """
-        Logical operation for bit vectors.
+        If the constructor is :obj:`bit` and no circuit is designated, the
+        instances are created without invoking the constructor of each one
+        (but they are otherwise the same as the instances it would create).
 
-        >>> results = []
-        >>> for (x, y) in [(0, 0), (0, 1), (1, 0), (1, 1)]:
-        ...     bit.circuit(circuit())
-        ...     (xs, ys) = (inputs([x, x, x]), inputs([y, y, y]))
-        ...     zs = outputs(xs.xor_(ys))
-        ...     ns = [int(z) for z in zs]
-        ...     c = bit.circuit()
-        ...     results.append(ns == c.evaluate([x, x, x, y, y, y]))
-        >>> all(results)
+        >>> _ = bit.circuit() # Remove designated circuit.
+        >>> [(type(b).__name__, b.value) for b in bits.from_byte(6)][-3:]
+        [('bit', 1), ('bit', 1), ('bit', 0)]
+        >>> [(type(b), b.value, b.gate) for b in bits.from_byte(6)] == [
+        ...     (type(b), b.value, b.gate) for b in map(bit, [0, 0, 0, 0, 0, 1, 1, 0])
+        ... ]
         True
+        >>> [type(b).__name__ for b in bits.from_byte(6, constant)][-3:]
+        ['constant', 'constant', 'constant']
         """
-        return bits([x.xor_(y) for (x, y) in zip(self, other)])
+        # pylint: disable=protected-access
+        if constructor is bit and bit._circuit is None:
+            return bits(bit._bulk(_BYTE_BITS[b & 255], [None] * 8))
 
-    def __xor__(self: bits, other: bits) -> bits:
-        """
-        Logical operation for bit vectors.
+        return bits([constructor(bit_) for bit_ in _BYTE_BITS[b & 255]])
 
-        >>> results = []
-        >>> for (x, y) in [(0, 0), (0, 1), (1, 0), (1, 1)]:
-        ...     bit.circuit(circuit())
-        ...     (xs, ys) = (inputs([x, x, x]), inputs([y, y, y]))
-        ...     zs = outputs(xs ^ ys)
-        ...     ns = [int(z) for z in zs]
-        ...     c = bit.circuit()
-        ...     results.append(ns == c.evaluate([x, x, x, y, y, y]))
-        >>> all(results)
-        True
+    @staticmethod
+    def from_bytes(bs: Union[bytes, bytearray], constructor=bit) -> bits:
         """
-        return bits([x.xor_(y) for (x, y) in zip(self, other)])
+        Convert a vector of bytes into a corresponding bit vector.
 
-    def or_(self: bits, other: bits) -> bits:
-        """
-        Logical operation for bit vectors.
+        >>> [b.value for b in bits.from_bytes(bytes([255]))]
+        [1, 1, 1, 1, 1, 1, 1, 1]
+        >>> [b.value for b in bits.from_bytes(bytes([11, 0]))]
+        [0, 0, 0, 0, 1, 0, 1, 1, 0, 0, 0, 0, 0, 0, 0, 0]
 
-        >>> results = []
-        >>> for (x, y) in [(0, 0), (0, 1), (1, 0), (1, 1)]:
-        ...     bit.circuit(circuit())
-        ...     (xs, ys) = (inputs([x, x, x]), inputs([y, y, y]))
-        ...     zs = outputs(xs.or_(ys))
-        ...     ns = [int(z) for z in zs]
-        ...     c = bit.circuit()
-        ...     results.append(ns == c.evaluate([x, x, x, y, y, y]))
-        >>> all(results)
-        True
-        """
-        return bits([x.or_(y) for (x, y) in zip(self, other)])
+        As with :obj:`bits.from_byte`, the entries have the same types as those
+        that the constructor would create.
 
-    def __or__(self: bits, other: bits) -> bits:
+        >>> _ = bit.circuit() # Remove designated circuit.
+        >>> {type(b).__name__ for b in bits.from_bytes(bytes([11, 0]))}
+        {'bit'}
+        >>> {type(b).__name__ for b in bits.from_bytes(bytes([11, 0]), constant)}
+        {'constant'}
         """
-        Logical operation for bit vectors.
+        # pylint: disable=protected-access
+        if constructor is bit and bit._circuit is None:
+            values = [bit_ for byte_ in bs for bit_ in _BYTE_BITS[byte_]]
+            return bits(bit._bulk(values, [None] * len(values)))
 
-        >>> results = []
-        >>> for (x, y) in [(0, 0), (0, 1), (1, 0), (1, 1)]:
-        ...     bit.circuit(circuit())
-        ...     (xs, ys) = (inputs([x, x, x]), inputs([y, y, y]))
-        ...     zs = outputs(xs | ys)
-        ...     ns = [int(z) for z in zs]
-        ...     c = bit.circuit()
-        ...     results.append(ns == c.evaluate([x, x, x, y, y, y]))
-        >>> all(results)
-        True
-        """
-        return bits([x.or_(y) for (x, y) in zip(self, other)])
+        return bits([
+            constructor(bit_)
+            for byte_ in bs
+            for bit_ in _BYTE_BITS[byte_]
+        ])
 
-    def nor(self: bits, other: bits) -> bits:
+    @staticmethod
+    def zeros(n: int) -> bits:
         """
-        Logical operation for bit vectors.
+        Create a vector (of the specified length) of constant zero bits.
 
-        >>> results = []
-        >>> for (x, y) in [(0, 0), (0, 1), (1, 0), (1, 1)]:
-        ...     bit.circuit(circuit())
-        ...     (xs, ys) = (inputs([x, x, x]), inputs([y, y, y]))
-        ...     zs = outputs(xs.nor(ys))
-        ...     ns = [int(z) for z in zs]
-        ...     c = bit.circuit()
-        ...     results.append(ns == c.evaluate([x, x, x, y, y, y]))
-        >>> all(results)
-        True
+        >>> bit.circuit(circuit())
+        >>> xs = bits.zeros(3)
+        >>> ys = outputs(xs.not_())
+        >>> [y.value for y in ys]
+        [1, 1, 1]
+        >>> _ = bit.circuit() # Remove designated circuit.
         """
-        return bits([x.nor_(y) for (x, y) in zip(self, other)])
+        return bits([constant(0)]*n)
 
-    def nor_(self: bits, other: bits) -> bits:
+    def __int__(self: bits) -> int:
         """
-        Logical operation for bit vectors.
+        Convert a bit vector into an integer.
 
-        >>> results = []
-        >>> for (x, y) in [(0, 0), (0, 1), (1, 0), (1, 1)]:
-        ...     bit.circuit(circuit())
-        ...     (xs, ys) = (inputs([x, x, x]), inputs([y, y, y]))
-        ...     zs = outputs(xs.nor_(ys))
-        ...     ns = [int(z) for z in zs]
-        ...     c = bit.circuit()
-        ...     results.append(ns == c.evaluate([x, x, x, y, y, y]))
-        >>> all(results)
-        True
-        """
-        return bits([x.nor_(y) for (x, y) in zip(self, other)])
+        >>> bit.circuit(circuit())
+        >>> xs = constants([0, 0, 0])
+        >>> ys = outputs(xs.not_())
+        >>> int(ys)
+        7
+        >>> _ = bit.circuit() # Remove designated circuit.
 
-    def __mod__(self: bits, other: bits) -> bits:
-        """
-        Logical operation for bit vectors.
+        The first bit in the vector is the most significant bit.
 
-        >>> results = []
-        >>> for (x, y) in [(0, 0), (0, 1), (1, 0), (1, 1)]:
-        ...     bit.circuit(circuit())
-        ...     (xs, ys) = (inputs([x, x, x]), inputs([y, y, y]))
-        ...     zs = outputs(xs % ys)
-        ...     ns = [int(z) for z in zs]
-        ...     c = bit.circuit()
-        ...     results.append(ns == c.evaluate([x, x, x, y, y, y]))
-        >>> all(results)
-        True
-        """
-        return bits([x.nor_(y) for (x, y) in zip(self, other)])
+        >>> int(bits(map(bit, [1, 0, 0])))
+        4
 
-    def xnor(self: bits, other: bits) -> bits:
-        """
-        Logical operation for bit vectors.
+        Long vectors are converted via a binary string (avoiding a large
+        integer shift for every bit).
 
-        >>> results = []
-        >>> for (x, y) in [(0, 0), (0, 1), (1, 0), (1, 1)]:
-        ...     bit.circuit(circuit())
-        ...     (xs, ys) = (inputs([x, x, x]), inputs([y, y, y]))
-        ...     zs = outputs(xs.xnor(ys))
-        ...     ns = [int(z) for z in zs]
-        ...     c = bit.circuit()
-        ...     results.append(ns == c.evaluate([x, x, x, y, y, y]))
-        >>> all(results)
+        >>> int(bits(map(bit, [1] + [0] * 99))) == 2 ** 99
         True
         """
-        return bits([x.xnor_(y) for (x, y) in zip(self, other)])
+        if len(self) > 64:
+            return int(''.join(['01'[b.value] for b in self]), 2)
 
-    def xnor_(self: bits, other: bits) -> bits:
-        """
-        Logical operation for bit vectors.
+        n = 0
+        for b in self:
+            n = (n << 1) | b.value
+        return n
 
-        >>> results = []
-        >>> for (x, y) in [(0, 0), (0, 1), (1, 0), (1, 1)]:
-        ...     bit.circuit(circuit())
-        ...     (xs, ys) = (inputs([x, x, x]), inputs([y, y, y]))
-        ...     zs = outputs(xs.xnor_(ys))
-        ...     ns = [int(z) for z in zs]
-        ...     c = bit.circuit()
-        ...     results.append(ns == c.evaluate([x, x, x, y, y, y]))
-        >>> all(results)
-        True
+    def _map_apply(self: bits, o: Callable, table: Optional[tuple] = None) -> bits:
         """
-        return bits([x.xnor_(y) for (x, y) in zip(self, other)])
+        Apply the supplied unary operation to every :obj:`bit` instance in this
+        bit vector. If no hook is assigned, the class attributes that determine
+        how results are constructed are read only once for the entire vector.
 
-    def __eq__(self: bits, other: bits) -> bits:
-        """
-        Logical operation for bit vectors.
+        >>> bit.circuit(circuit())
+        >>> xs = bits([input(0), constant(1), input(1)])
+        >>> ys = xs._map_apply(op.not_)
+        >>> [(type(y).__name__, y.value) for y in ys]
+        [('bit', 1), ('constant', 0), ('bit', 0)]
+        >>> ys = outputs(ys)
+        >>> bit.circuit().evaluate([0, 1])
+        [1, 0, 0]
+        >>> bits([output(bit(1))])._map_apply(op.not_)
+        Traceback (most recent call last):
+          ...
+        TypeError: cannot supply an output as an argument to an operation
 
-        >>> results = []
-        >>> for (x, y) in [(0, 0), (0, 1), (1, 0), (1, 1)]:
-        ...     bit.circuit(circuit())
-        ...     (xs, ys) = (inputs([x, x, x]), inputs([y, y, y]))
-        ...     zs = outputs(xs == ys)
-        ...     ns = [int(z) for z in zs]
-        ...     c = bit.circuit()
-        ...     results.append(ns == c.evaluate([x, x, x, y, y, y]))
-        >>> all(results)
-        True
-        """
-        return bits([x.xnor_(y) for (x, y) in zip(self, other)])
+        Results are constructed in the same way as by :obj:`bit._unop` when no
+        circuit is designated (including when value computation is disabled).
 
-    def if_(self: bits, other: bits) -> bits:
-        """
-        Logical operation for bit vectors.
+        >>> xs = bits([bit(0), constant(1)])
+        >>> [(type(y).__name__, y.value) for y in xs._map_apply(op.not_)]
+        [('bit', 1), ('constant', 0)]
+        >>> bit.values(False)
+        >>> [(type(y).__name__, y.value) for y in xs._map_apply(op.not_)]
+        [('bit', 0), ('constant', 0)]
+        >>> bit.values()
 
-        >>> results = []
-        >>> for (x, y) in [(0, 0), (0, 1), (1, 0), (1, 1)]:
-        ...     bit.circuit(circuit())
-        ...     (xs, ys) = (inputs([x, x, x]), inputs([y, y, y]))
-        ...     zs = outputs(xs.if_(ys))
-        ...     ns = [int(z) for z in zs]
-        ...     c = bit.circuit()
-        ...     results.append(ns == c.evaluate([x, x, x, y, y, y]))
-        >>> all(results)
-        True
-        """
-        return bits([x.if_(y) for (x, y) in zip(self, other)])
+        If a hook is assigned, every entry is passed to it (via :obj:`bit._unop`).
 
-    def __ge__(self: bits, other: bits) -> bits:
+        >>> bit.hook_operation(lambda o, v, *args: constant(v))
+        >>> [(type(y).__name__, y.value) for y in xs._map_apply(op.not_)]
+        [('constant', 1), ('constant', 0)]
+        >>> bit.hook_operation()
         """
-        Logical operation for bit vectors.
+        # pylint: disable=protected-access
+        table = _TRUTH_TABLES[o] if table is None else table
+        if bit._hook_operation is not None:
+            unop = bit._unop
+            return bits([unop(o, x, table) for x in self])
+
+        constants_ = False
+        for x in self:
+            if x._is_output:
+                raise TypeError('cannot supply an output as an argument to an operation')
+            constants_ = constants_ or isinstance(x, constant)
+
+        # As in :obj:`bits._zip_apply`, results are created in bulk if no entry
+        # can be folded (whether or not a circuit is designated).
+        if not constants_:
+            return bits(bit._bulk(
+                [table[x.value] for x in self] if bit._compute_values else [0] * len(self),
+                bit._gates(o, [(x._gate,) for x in self])
+            ))
+
+        (gate, values) = (bit.gate, bit._compute_values)
+        ys = bits()
+        for x in self:
+            if isinstance(x, constant):
+                ys.append(constant(table[x.value]))
+            else:
+                ys.append(bit(table[x.value] if values else 0, gate(o, (x._gate,))))
+
+        return ys
+
+    def _zip_apply(
+            self: bits, other: bits, o: Callable, table: Optional[tuple] = None
+        ) -> bits:
+        """
+        Apply the supplied binary operation to every pair of corresponding
+        :obj:`bit` instances in this bit vector and the other bit vector. The
+        truth table of the operation can be supplied by the caller (as with
+        :obj:`bit._binop`).
+
+        >>> xs = bits(map(bit, [0, 0, 1, 1]))
+        >>> ys = bits(map(bit, [0, 1, 0, 1]))
+        >>> [z.value for z in xs._zip_apply(ys, op.xor_)]
+        [0, 1, 1, 0]
+
+        If no circuit is designated, results are constructed in the same way as
+        by :obj:`bit._binop` (including when value computation is disabled).
+
+        >>> (xs, ys) = (bits([bit(1), constant(1)]), bits([bit(1), constant(1)]))
+        >>> [(type(z).__name__, z.value) for z in xs._zip_apply(ys, op.and_)]
+        [('bit', 1), ('constant', 1)]
+        >>> bit.values(False)
+        >>> [(type(z).__name__, z.value) for z in xs._zip_apply(ys, op.and_)]
+        [('bit', 0), ('constant', 1)]
+        >>> bit.values()
+
+        If a hook is assigned, every pair is passed to it (via :obj:`bit._binop`).
+
+        >>> bit.hook_operation(lambda o, v, *args: constant(v))
+        >>> [(type(z).__name__, z.value) for z in xs._zip_apply(ys, op.and_)]
+        [('constant', 1), ('constant', 1)]
+        >>> bit.hook_operation()
 
-        >>> results = []
-        >>> for (x, y) in [(0, 0), (0, 1), (1, 0), (1, 1)]:
-        ...     bit.circuit(circuit())
-        ...     (xs, ys) = (inputs([x, x, x]), inputs([y, y, y]))
-        ...     zs = outputs(xs >= ys)
-        ...     ns = [int(z) for z in zs]
-        ...     c = bit.circuit()
-        ...     results.append(ns == c.evaluate([x, x, x, y, y, y]))
-        >>> all(results)
-        True
-        """
-        return bits([x.if_(y) for (x, y) in zip(self, other)])
+        The other vector may contain integers in place of :obj:`bit` instances.
 
-    def imp(self: bits, other: bits) -> bits:
-        """
-        Logical operation for bit vectors.
+        >>> xs = bits([bit(1), bit(0), bit(1)])
+        >>> [(type(z).__name__, z.value) for z in xs._zip_apply(bits([1, 0, 1]), op.and_)]
+        [('bit', 1), ('constant', 0), ('bit', 1)]
+        >>> [z.value for z in xs & bits([0, 0, 1])]
+        [0, 0, 1]
 
-        >>> results = []
-        >>> for (x, y) in [(0, 0), (0, 1), (1, 0), (1, 1)]:
-        ...     bit.circuit(circuit())
-        ...     (xs, ys) = (inputs([x, x, x]), inputs([y, y, y]))
-        ...     zs = outputs(xs.imp(ys))
-        ...     ns = [int(z) for z in zs]
-        ...     c = bit.circuit()
-        ...     results.append(ns == c.evaluate([x, x, x, y, y, y]))
-        >>> all(results)
-        True
-        """
-        return bits([x.imp_(y) for (x, y) in zip(self, other)])
+        Arguments that are instances of :obj:`output` are not permitted.
 
-    def imp_(self: bits, other: bits) -> bits:
-        """
-        Logical operation for bit vectors.
+        >>> xs = bits([bit(0), output(bit(1))])
+        >>> xs._zip_apply(xs, op.and_)
+        Traceback (most recent call last):
+          ...
+        TypeError: cannot supply an output as an argument to an operation
 
-        >>> results = []
-        >>> for (x, y) in [(0, 0), (0, 1), (1, 0), (1, 1)]:
-        ...     bit.circuit(circuit())
-        ...     (xs, ys) = (inputs([x, x, x]), inputs([y, y, y]))
-        ...     zs = outputs(xs.imp_(ys))
-        ...     ns = [int(z) for z in zs]
-        ...     c = bit.circuit()
-        ...     results.append(ns == c.evaluate([x, x, x, y, y, y]))
-        >>> all(results)
-        True
-        """
-        return bits([x.imp_(y) for (x, y) in zip(self, other)])
+        If a circuit is designated (and no hook is assigned), the gates for all
+        pairs are added to it in a single pass over the vectors (folding pairs
+        involving constants in the same way as :obj:`bit.operation`).
 
-    def __le__(self: bits, other: bits) -> bits:
-        """
-        Logical operation for bit vectors.
+        >>> bit.circuit(circuit())
+        >>> xs = inputs([0, 0, 1, 1])
+        >>> ys = bits([input(0), constant(1), input(0), constant(0)])
+        >>> zs = xs._zip_apply(ys, op.and_)
+        >>> [type(z).__name__ for z in zs]
+        ['bit', 'bit', 'bit', 'constant']
+        >>> zs = outputs(zs)
+        >>> bit.circuit().evaluate([0, 0, 1, 1, 1, 1])
+        [0, 0, 1, 0]
+        """
+        # pylint: disable=protected-access
+        table = _TRUTH_TABLES[o] if table is None else table
+        # Vectors that contain integers (rather than only :obj:`bit` instances)
+        # are handled by applying :obj:`bit._binop` to each pair.
+        if (
+            bit._hook_operation is None and isinstance(other, bits) and
+            all(isinstance(y, bit) for y in other)
+        ):
+            pairs = list(zip(self, other))
+            constants_ = False
+            for (x, y) in pairs:
+                if x._is_output or y._is_output:
+                    raise TypeError('cannot supply an output as an argument to an operation')
+                constants_ = constants_ or isinstance(x, constant) or isinstance(y, constant)
+
+            # If no pair can be folded, the values and the gates of the results
+            # are computed as two separate lists from which the results are
+            # then created in bulk (whether or not a circuit is designated).
+            if not constants_:
+                return bits(bit._bulk(
+                    [table[(x.value << 1) | y.value] for (x, y) in pairs]
+                    if bit._compute_values else
+                    [0] * len(pairs),
+                    bit._gates(o, [(x._gate, y._gate) for (x, y) in pairs])
+                ))
+
+            (gate, folds, values) = (bit.gate, bit._folds, bit._compute_values)
+            zs = bits()
+            for (x, y) in pairs:
+                v = table[(x.value << 1) | y.value]
+                if (isinstance(x, constant) or isinstance(y, constant)) and folds(o, x, y):
+                    zs.append(constant(v))
+                else:
+                    zs.append(bit(v if values else 0, gate(o, (x._gate, y._gate))))
+
+            return zs
+
+        binop = bit._binop
+        return bits([binop(o, x, y, table) for (x, y) in zip(self, other)])
+
+    not_ = _operation_method('bits', 'not_', op.not_, 'xs.not_()')
+    __invert__ = _operation_method('bits', '__invert__', op.not_, '~xs')
+
+    and_ = _operation_method('bits', 'and_', op.and_, 'xs.and_(ys)')
+    __and__ = _operation_method('bits', '__and__', op.and_, 'xs & ys')
+
+    nimp = _operation_method('bits', 'nimp', op.nimp_, 'xs.nimp(ys)')
+    nimp_ = _operation_method('bits', 'nimp_', op.nimp_, 'xs.nimp_(ys)')
+    __gt__ = _operation_method('bits', '__gt__', op.nimp_, 'xs > ys')
+    and_not = _operation_method('bits', 'and_not', op.nimp_, 'xs.and_not(ys)') # Alias of ``nimp_``.
+
+    nif = _operation_method('bits', 'nif', op.nif_, 'xs.nif(ys)')
+    nif_ = _operation_method('bits', 'nif_', op.nif_, 'xs.nif_(ys)')
+    __lt__ = _operation_method('bits', '__lt__', op.nif_, 'xs < ys')
+
+    xor = _operation_method('bits', 'xor', op.xor_, 'xs.xor(ys)')
+    xor_ = _operation_method('bits', 'xor_', op.xor_, 'xs.xor_(ys)')
+    __xor__ = _operation_method('bits', '__xor__', op.xor_, 'xs ^ ys')
+
+    or_ = _operation_method('bits', 'or_', op.or_, 'xs.or_(ys)')
+    __or__ = _operation_method('bits', '__or__', op.or_, 'xs | ys')
+
+    nor = _operation_method('bits', 'nor', op.nor_, 'xs.nor(ys)')
+    nor_ = _operation_method('bits', 'nor_', op.nor_, 'xs.nor_(ys)')
+    __mod__ = _operation_method('bits', '__mod__', op.nor_, 'xs % ys')
+
+    xnor = _operation_method('bits', 'xnor', op.xnor_, 'xs.xnor(ys)')
+    xnor_ = _operation_method('bits', 'xnor_', op.xnor_, 'xs.xnor_(ys)')
+    __eq__ = _operation_method('bits', '__eq__', op.xnor_, 'xs == ys')
+
+    if_ = _operation_method('bits', 'if_', op.if_, 'xs.if_(ys)')
+    __ge__ = _operation_method('bits', '__ge__', op.if_, 'xs >= ys')
+
+    imp = _operation_method('bits', 'imp', op.imp_, 'xs.imp(ys)')
+    imp_ = _operation_method('bits', 'imp_', op.imp_, 'xs.imp_(ys)')
+    __le__ = _operation_method('bits', '__le__', op.imp_, 'xs <= ys')
+
+    nand = _operation_method('bits', 'nand', op.nand_, 'xs.nand(ys)')
+    nand_ = _operation_method('bits', 'nand_', op.nand_, 'xs.nand_(ys)')
 
-        >>> results = []
-        >>> for (x, y) in [(0, 0), (0, 1), (1, 0), (1, 1)]:
-        ...     bit.circuit(circuit())
-        ...     (xs, ys) = (inputs([x, x, x]), inputs([y, y, y]))
-        ...     zs = outputs(xs <= ys)
-        ...     ns = [int(z) for z in zs]
-        ...     c = bit.circuit()
-        ...     results.append(ns == c.evaluate([x, x, x, y, y, y]))
-        >>> all(results)
-        True
-        """
-        return bits([x.imp_(y) for (x, y) in zip(self, other)])
+    @staticmethod
+    def _fused(o0: Callable, o1: Callable, xs: bits, ys: bits, zs: bits) -> bits:
+        """
+        Apply the first operation to every pair of corresponding entries of the
+        first two vectors and then the second operation to each result and the
+        corresponding entry of the third vector (in a single pass, without an
+        intermediate bit vector).
+
+        >>> xs = bits(map(bit, [0, 1, 1]))
+        >>> ys = bits(map(bit, [1, 1, 0]))
+        >>> zs = bits(map(bit, [1, 1, 1]))
+        >>> [b.value for b in bits._fused(op.and_, op.xor_, xs, ys, zs)]
+        [1, 0, 1]
+
+        If no hook is assigned and no entry is a :obj:`constant` or
+        :obj:`output` instance, no intermediate :obj:`bit` instances are
+        created either: the values and the gates of the intermediate results
+        are computed directly and the results are created in bulk. The gates
+        that are introduced are the same as those introduced by applying the
+        two operations in sequence.
+
+        >>> bit.circuit(circuit())
+        >>> (xs, ys, zs) = (inputs([0, 1]), inputs([1, 1]), inputs([1, 0]))
+        >>> ws = outputs(bits._fused(op.and_, op.xor_, xs, ys, zs))
+        >>> c = bit.circuit()
+        >>> (c.count(), c.evaluate([0, 1, 1, 1, 1, 0]))
+        (12, [1, 1])
+        >>> bit.circuit(circuit())
+        >>> (xs, ys, zs) = (inputs([0, 1]), inputs([1, 1]), inputs([1, 0]))
+        >>> ws = outputs((xs & ys) ^ zs)
+        >>> bit.circuit().count()
+        12
+
+        Otherwise, the operations are applied to each entry in sequence.
+
+        >>> xs = bits([constant(0), bit(1)])
+        >>> [(type(w).__name__, w.value) for w in bits._fused(op.and_, op.xor_, xs, xs, xs)]
+        [('constant', 0), ('bit', 0)]
+        """
+        # pylint: disable=protected-access
+        (t0, t1) = (_TRUTH_TABLES[o0], _TRUTH_TABLES[o1])
+        triples = list(zip(xs, ys, zs))
+        if bit._hook_operation is None and all(
+                isinstance(w, bit) and not isinstance(w, constant) and not w._is_output
+                for triple in triples for w in triple
+            ):
+            vs = (
+                [t1[(t0[(x.value << 1) | y.value] << 1) | z.value] for (x, y, z) in triples]
+                if bit._compute_values else
+                [0] * len(triples)
+            )
+            gs = bit._gates(o0, [(x._gate, y._gate) for (x, y, _) in triples])
+            gs = bit._gates(o1, [(g, z._gate) for (g, (_, _, z)) in zip(gs, triples)])
+            return bits(bit._bulk(vs, gs))
 
-    def nand(self: bits, other: bits) -> bits:
+        binop = bit._binop
+        return bits([binop(o1, binop(o0, x, y, t0), z, t1) for (x, y, z) in triples])
+
+    @staticmethod
+    def and_xor(xs: bits, ys: bits, zs: bits) -> bits:
         """
-        Logical operation for bit vectors.
+        Fused logical operation for bit vectors that is equivalent to
+        ``(xs & ys) ^ zs``.
 
         >>> results = []
-        >>> for (x, y) in [(0, 0), (0, 1), (1, 0), (1, 1)]:
+        >>> for (x, y, z) in product((0, 1), repeat=3):
         ...     bit.circuit(circuit())
-        ...     (xs, ys) = (inputs([x, x, x]), inputs([y, y, y]))
-        ...     zs = outputs(xs.nand(ys))
-        ...     ns = [int(z) for z in zs]
+        ...     (xs, ys, zs) = (inputs([x, x]), inputs([y, y]), inputs([z, z]))
+        ...     ws = outputs(bits.and_xor(xs, ys, zs))
+        ...     ns = [int(w) for w in ws]
         ...     c = bit.circuit()
-        ...     results.append(ns == c.evaluate([x, x, x, y, y, y]))
+        ...     results.append(ns == c.evaluate([x, x, y, y, z, z]) == [(x & y) ^ z] * 2)
         >>> all(results)
         True
         """
-        return bits([x.nand_(y) for (x, y) in zip(self, other)])
+        return bits._fused(op.and_, op.xor_, xs, ys, zs)
 
-    def nand_(self: bits, other: bits) -> bits:
+    @staticmethod
+    def xor_xor(xs: bits, ys: bits, zs: bits) -> bits:
         """
-        Logical operation for bit vectors.
+        Fused logical operation for bit vectors that is equivalent to
+        ``(xs ^ ys) ^ zs``.
 
         >>> results = []
-        >>> for (x, y) in [(0, 0), (0, 1), (1, 0), (1, 1)]:
+        >>> for (x, y, z) in product((0, 1), repeat=3):
         ...     bit.circuit(circuit())
-        ...     (xs, ys) = (inputs([x, x, x]), inputs([y, y, y]))
-        ...     zs = outputs(xs.nand_(ys))
-        ...     ns = [int(z) for z in zs]
+        ...     (xs, ys, zs) = (inputs([x, x]), inputs([y, y]), inputs([z, z]))
+        ...     ws = outputs(bits.xor_xor(xs, ys, zs))
+        ...     ns = [int(w) for w in ws]
         ...     c = bit.circuit()
-        ...     results.append(ns == c.evaluate([x, x, x, y, y, y]))
+        ...     results.append(ns == c.evaluate([x, x, y, y, z, z]) == [x ^ y ^ z] * 2)
         >>> all(results)
         True
         """
-        return bits([x.nand_(y) for (x, y) in zip(self, other)])
+        return bits._fused(op.xor_, op.xor_, xs, ys, zs)
 
     def __rshift__(self: bits, other: Union[int, set]) -> bits:
         """
@@ -1445,13 +1458,16 @@ class bits(list):
         >>> [b.value for b in bs]
         [1, 1, 1, 0, 0, 0, 0, 1]
         """
+        n = len(self)
+
         # Rotation.
-        if isinstance(other, set) and isinstance(list(other)[0], int):
-            quantity = list(other)[0]
-            return bits(self[len(self)-quantity:]) ** bits(self[0:len(self)-quantity])
+        quantity = next(iter(other), None) if isinstance(other, set) else None
+        if isinstance(quantity, int):
+            k = n - quantity
+            return bits(self[k:] + self[0:k])
 
-        # Shift.
-        return bits([constant(0)]*other) ** bits(self[0:len(self)-other])
+        # Shift (building the result in a single list).
+        return bits([constant(0)]*other + self[0:n-other])
 
     def __lshift__(self: bits, other: int) -> bits:
         """
@@ -1462,7 +1478,7 @@ class bits(list):
         >>> [b.value for b in bs]
         [1, 0, 0, 0, 0, 0, 0, 0]
         """
-        return bits(self[other:]) ** bits([constant(0) for _ in range(other)])
+        return bits(self[other:] + [constant(0)]*other)
 
     def __truediv__(self: bits, other: [Union, set, list]) -> Sequence[bits]:
         """
@@ -1503,12 +1519,42 @@ class bits(list):
         >>> bss = list(bs / [1, 3, 4])
         >>> [[b.value for b in bs] for bs in bss]
         [[1], [1, 1, 1], [0, 0, 0, 0]]
+
+        Lists of part lengths are validated (and rejected if they are invalid).
+
+        >>> bs = bits(map(bit, [1, 0, 1, 1]))
+        >>> list(bs / [5, -1])
+        Traceback (most recent call last):
+          ...
+        ValueError: object has too few items to retrieve parts having specified part lengths
+        >>> list(bs / [2, -1, 3])
+        Traceback (most recent call last):
+          ...
+        ValueError: object has too few items to retrieve parts having specified part lengths
+
+        If the length specified in a set does not divide the length of this
+        instance, the number of parts is determined by the quotient of the two
+        lengths (as when the second parameter is an integer).
+
+        >>> bs = bits(map(bit, [1, 1, 1, 1, 0, 0, 0, 0]))
+        >>> [len(bs) for bs in bs / {3}]
+        [4, 4]
         """
         if isinstance(other, list) and len(other) > 0 and isinstance(other[0], int):
-            return map(bits, parts(self, length=other)) # Sequence of lengths.
-
-        if isinstance(other, set) and len(other) == 1 and isinstance(list(other)[0], int):
-            return self / (len(self)//list(other)[0]) # Parts of length `other`.
+            # Sequence of lengths (split directly if the lengths are all positive
+            # and cover this instance exactly; otherwise, `parts` validates them).
+            if all(isinstance(n, int) and n > 0 for n in other) and sum(other) == len(self):
+                offsets = list(accumulate(other))
+                return map(bits, (self[i:j] for (i, j) in zip([0] + offsets, offsets)))
+            return map(bits, parts(self, length=other))
+
+        length = next(iter(other)) if isinstance(other, set) and len(other) == 1 else None
+        if isinstance(length, int):
+            # Parts of length `other` (split directly if the length divides that of
+            # this instance).
+            if length > 0 and len(self) % length == 0:
+                return map(bits, (self[i:i + length] for i in range(0, len(self), length)))
+            return self / (len(self)//length)
 
         return map(bits, parts(self, other)) # Number of parts is `other`.
 
@@ -1520,9 +1566,9 @@ class bits(list):
         >>> [b.value for b in bs]
         [1, 1, 0, 0]
         """
-        result = list(self)
-        result.extend(list(other))
-        return bits(result)
+        result = bits(self)
+        result.extend(other)
+        return result
 
     def __pow__(self: bits, other: Union[bits, Sequence[int]]) -> bits:
         """
@@ -1546,7 +1592,11 @@ def constants(l: Sequence[int]) -> bits:
     7
     >>> _ = bit.circuit() # Remove designated circuit.
     """
-    return bits(map(constant, l))
+    vs = list(l)
+    return bits(constant._bulk( # pylint: disable=protected-access
+        vs,
+        [bit._simplified_gate(op.nf_ if v == 0 else op.nt_, ()) for v in vs] # pylint: disable=protected-access
+    ))
 
 def inputs(l: Sequence[int]) -> bits:
     """
@@ -1561,8 +1611,22 @@ def inputs(l: Sequence[int]) -> bits:
     >>> c = bit.circuit()
     >>> ns == c.evaluate([1, 1, 1])
     True
+
+    The instances are created (and one input gate per value is added to the
+    designated circuit, if there is one) without invoking the constructor of
+    each individual instance.
+
+    >>> [type(x).__name__ for x in inputs([0, 1])]
+    ['input', 'input']
+    >>> [x.value for x in inputs([0, 1])]
+    [0, 1]
     """
-    return bits(map(input, l))
+    c = bit._circuit # pylint: disable=protected-access
+    vs = list(l)
+    return bits(input._bulk( # pylint: disable=protected-access
+        vs,
+        [None] * len(vs) if c is None else [c.gate(op.id_, is_input=True) for _ in vs]
+    ))
 
 def outputs(l: Sequence[int]) -> bits:
     """
@@ -1576,7 +1640,186 @@ def outputs(l: Sequence[int]) -> bits:
     [1, 1, 1]
     >>> _ = bit.circuit() # Remove designated circuit.
     """
-    return bits(map(output, l))
+    c = bit._circuit # pylint: disable=protected-access
+    bs = list(l)
+    return bits(output._bulk( # pylint: disable=protected-access
+        [b.value for b in bs],
+        [None] * len(bs) if c is None else [c.gate(op.id_, (b.gate,), is_output=True) for b in bs]
+    ))
+
+# Bitwise implementations (on words in which each bit is one lane) of the
+# operations that can appear in a circuit, indexed by their truth tables. Each
+# implementation takes a mask that has a 1 in every lane as its first argument.
+_PACKED_OPERATIONS = {
+    (0,): lambda m: 0,
+    (1,): lambda m: m,
+    (0, 1): lambda m, x: x,
+    (1, 0): lambda m, x: ~x & m,
+    (0, 0, 0, 1): lambda m, x, y: x & y,
+    (0, 0, 1, 0): lambda m, x, y: x & ~y,
+    (0, 1, 0, 0): lambda m, x, y: ~x & y,
+    (0, 1, 1, 0): lambda m, x, y: x ^ y,
+    (0, 1, 1, 1): lambda m, x, y: x | y,
+    (1, 0, 0, 0): lambda m, x, y: ~(x | y) & m,
+    (1, 0, 0, 1): lambda m, x, y: ~(x ^ y) & m,
+    (1, 0, 1, 1): lambda m, x, y: (x | ~y) & m,
+    (1, 1, 0, 1): lambda m, x, y: (~x | y) & m,
+    (1, 1, 1, 0): lambda m, x, y: ~(x & y) & m
+}
+
+def _packed_operation(o: Callable, arity: int) -> Callable:
+    """
+    Return a bitwise implementation of the supplied operation (as used by
+    :obj:`_evaluate_packed` to evaluate circuits via :obj:`evaluate_many`).
+
+    >>> f = _packed_operation(op.imp_, 2)
+    >>> bin(f(0b1111, 0b1010, 0b1100))
+    '0b1101'
+    >>> all(
+    ...     _packed_operation(o, 2)(0b1111, 0b1100, 0b1010) ==
+    ...     sum(o(x, y) << i for (i, (x, y)) in enumerate([(0, 0), (0, 1), (1, 0), (1, 1)]))
+    ...     for o in [op.and_, op.nimp_, op.nif_, op.xor_, op.or_, op.nor_, op.xnor_, op.if_]
+    ... )
+    True
+
+    Other operations (including those of other arities) are implemented by
+    combining the rows of their truth tables that have a result of ``1``.
+
+    >>> f = _packed_operation(op.fst_, 2)
+    >>> bin(f(0b1111, 0b1010, 0b1100))
+    '0b1010'
+    >>> g = _packed_operation(lambda x, y, z: x & (y | z), 3)
+    >>> bin(g(0b11111111, 0b11110000, 0b11001100, 0b10101010))
+    '0b11100000'
+    """
+    rows = list(product((0, 1), repeat=arity))
+    table = tuple(o(*row) for row in rows)
+    if table in _PACKED_OPERATIONS:
+        return _PACKED_OPERATIONS[table]
+
+    def operation(mask, *args):
+        # Combine (via disjunction) the conjunctions that correspond to the
+        # rows of the truth table of the operation that have a result of 1.
+        w = 0
+        for (row, result) in zip(rows, table):
+            if result:
+                term = mask
+                for (a, v) in zip(args, row):
+                    term &= a if v else ~a
+                w |= term
+        return w
+
+    return operation
+
+def _evaluate_packed(c: circuit, words: Sequence[int], lanes: int) -> list:
+    """
+    Evaluate a circuit on several input assignments at once. Each entry in
+    the supplied sequence of words corresponds to one input gate, and each
+    bit of a word (up to the specified number of lanes) is the value of that
+    input in one of the assignments. The result contains one word for each
+    output gate (organized in the same way).
+
+    >>> bit.circuit(circuit())
+    >>> (x, y) = (input(0), input(0))
+    >>> (z0, z1) = outputs([x & y, x ^ y])
+    >>> c = bit.circuit()
+    >>> [bin(w) for w in _evaluate_packed(c, [0b1010, 0b1100], 4)]
+    ['0b1000', '0b110']
+
+    Each lane of the result matches the result of evaluating the circuit on
+    the corresponding assignment.
+
+    >>> ws = _evaluate_packed(c, [0b1010, 0b1100], 4)
+    >>> all(
+    ...     [(w >> i) & 1 for w in ws] == c.evaluate([(0b1010 >> i) & 1, (0b1100 >> i) & 1])
+    ...     for i in range(4)
+    ... )
+    True
+    """
+    mask = (1 << lanes) - 1
+    words = iter(words)
+    functions = {} # Bitwise implementation of each distinct operation.
+    values = {}
+    results = []
+    for g in c.gates:
+        if g.is_input:
+            w = next(words) & mask
+        else:
+            f = functions.get(id(g.operation))
+            if f is None:
+                f = functions[id(g.operation)] = _packed_operation(g.operation, len(g.inputs))
+            w = f(mask, *[values[id(ig)] for ig in g.inputs])
+
+        values[id(g)] = w
+        if g.is_output:
+            results.append(w)
+
+    return results
+
+def evaluate_many(c: circuit, batch: Sequence[Sequence]) -> list:
+    """
+    Evaluate a circuit on each input in the supplied batch and return a list
+    containing the corresponding outputs. Each input (and each output) is
+    organized in the same way as for the :obj:`~circuit.circuit.circuit.evaluate`
+    method (*i.e.*, in accordance with the signature of the circuit). All of
+    the inputs are evaluated together in a single pass over the gates of the
+    circuit, with each bit of an integer word holding the value of a wire for
+    one of the inputs.
+
+    >>> bit.circuit(circuit())
+    >>> (x, y) = (input(0), input(0))
+    >>> (z0, z1) = outputs([x & y, x ^ y])
+    >>> c = bit.circuit()
+    >>> vectors = [[0, 0], [0, 1], [1, 0], [1, 1]]
+    >>> evaluate_many(c, vectors)
+    [[0, 0], [0, 1], [0, 1], [1, 0]]
+    >>> evaluate_many(c, vectors) == [c.evaluate(v) for v in vectors]
+    True
+    >>> evaluate_many(c, [])
+    []
+    >>> bit.circuit(circuit())
+    >>> _ = input(0)
+    >>> evaluate_many(bit.circuit(), [[0], [1]])
+    [[], []]
+
+    If the circuit has a signature that specifies input and output formats,
+    the inputs and outputs are lists of bit vectors.
+
+    >>> c.signature = signature([1, 1], [2])
+    >>> evaluate_many(c, [[[0], [1]], [[1], [1]]])
+    [[[0, 1]], [[1, 0]]]
+    >>> evaluate_many(c, [[[0], [1]], [[1], [1]]]) == [c.evaluate([[0], [1]]), c.evaluate([[1], [1]])]
+    True
+
+    Every input is checked before any evaluation takes place.
+
+    >>> c.signature = signature()
+    >>> evaluate_many(c, [[0, 1], [1]])
+    Traceback (most recent call last):
+      ...
+    ValueError: each input must contain one bit for every input gate of the circuit
+    """
+    vectors = [c.signature.input(i) for i in batch]
+    if len(vectors) == 0:
+        return []
+
+    count = c.count(lambda g: g.is_input)
+    if any(len(vector) != count for vector in vectors):
+        raise ValueError('each input must contain one bit for every input gate of the circuit')
+
+    # Build each input word from a string of bits (in which the first input
+    # occupies the least significant position) rather than via repeated shifts.
+    lanes = len(vectors)
+    words = [
+        int(''.join(['01'[vector[i]] for vector in reversed(vectors)]), 2)
+        for i in range(count)
+    ]
+    columns = [format(w, '0' + str(lanes) + 'b')[::-1] for w in _evaluate_packed(c, words, lanes)]
+    if len(columns) == 0:
+        return [c.signature.output([]) for _ in range(lanes)]
+
+    values = {'0': 0, '1': 1}
+    return [c.signature.output([values[b] for b in row]) for row in zip(*columns)]
 
 def synthesize(function: Callable, in_type=None, out_type=None) -> Callable:
     """
@@ -1666,6 +1909,16 @@ def synthesize(function: Callable, in_type=None, out_type=None) -> Callable:
       ...
     TypeError: output type must be specified using bit/bits, or a list/tuple thereof
 
+    Type annotations that have already been evaluated (as in a module that does
+    not use PEP 563) are also supported.
+
+    >>> def equal(x, y):
+    ...     return (x & y) | ((1 - x) & (1 - y))
+    >>> equal.__annotations__ = {'x': bit, 'y': bit, 'return': bit}
+    >>> equal = synthesize(equal)
+    >>> [equal.circuit.evaluate([[x], [y]]) for x in (0, 1) for y in (0, 1)]
+    [[[1]], [[0]], [[0]], [[1]]]
+
     If an exception occurs during the execution (for the purpose of circuit synthesis)
     of the decorated function, then synthesis will fail.
 
@@ -1747,8 +2000,18 @@ def synthesize(function: Callable, in_type=None, out_type=None) -> Callable:
     # it is determined otherwise.
     type_supplied_via_annotation = True
 
-    # For forward-compatibility with PEP 563.
-    eval_ = lambda a: eval(a) if isinstance(a, str) else a # pylint: disable=W0123
+    # For forward-compatibility with PEP 563 (each distinct string annotation is
+    # evaluated only once during this invocation).
+    evaluated = {}
+    def eval_(a):
+        if not isinstance(a, str):
+            return a
+        if a not in evaluated:
+            evaluated[a] = eval(a) # pylint: disable=W0123
+        return evaluated[a]
+
+    # Names of the function's arguments (retrieved once for use in the checks below).
+    arguments = inspect.getfullargspec(function).args
 
     # If the type information is supplied via parameters, then both input and output
     # types must be supplied.
@@ -1781,11 +2044,11 @@ def synthesize(function: Callable, in_type=None, out_type=None) -> Callable:
         # to the corresponding type information (*i.e.*, if the user supplied a tuple or list
         # and not a dictionary for the input type information).
         if isinstance(in_type, (tuple, list)):
-            if len(in_type) != len(inspect.getfullargspec(function).args):
+            if len(in_type) != len(arguments):
                 raise ValueError(
                     'number of input type components does not match number of function arguments'
                 )
-            in_type = dict(zip(inspect.getfullargspec(function).args, in_type))
+            in_type = dict(zip(arguments, in_type))
 
         # Ensure that the output type is specified in a valid way.
         if out_type is bit or isinstance(out_type, bits_type):
@@ -1806,7 +2069,7 @@ def synthesize(function: Callable, in_type=None, out_type=None) -> Callable:
         if (
             len([() for k in function.__annotations__ if k != 'return'])
             !=
-            len(inspect.getfullargspec(function).args)
+            len(arguments)
         ):
             print(function.__code__.co_varnames)
             print(function.__annotations__)
@@ -1814,9 +2077,10 @@ def synthesize(function: Callable, in_type=None, out_type=None) -> Callable:
         if 'return' not in function.__annotations__:
             raise ValueError('function must have an output type annotation')
 
-        # Extract the type annotations and evaluate them for later processing.
-        in_type = {k: eval_(a) for (k, a) in function.__annotations__.items() if k != 'return'}
-        out_type = eval_(function.__annotations__['return'])
+        # Extract the type annotations and evaluate them (in a single pass) for later
+        # processing.
+        in_type = {k: eval_(a) for (k, a) in function.__annotations__.items()}
+        out_type = in_type.pop('return')
 
         # Ensure that every argument's type annotation is specified in a valid way.
         if not all(t is bit or isinstance(t, bits_type) for t in in_type.values()):
@@ -1867,4 +2131,5 @@ def synthesize(function: Callable, in_type=None, out_type=None) -> Callable:
     return function if type_supplied_via_annotation else function_circuit
 
 if __name__ == '__main__':
+    import doctest # pylint: disable=import-outside-toplevel # pragma: no cover
     doctest.testmod() # pragma: no cover
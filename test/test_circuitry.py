@@ -19,12 +19,12 @@ from parts import parts
 from bitlist import bitlist
 
 try:
-    from circuitry import bit, bits, constants, synthesize
+    from circuitry import bit, bits, constants, evaluate_many, synthesize
 except: # pylint: disable=bare-except
     # Support validation of docstrings in this script via its direct execution.
     import sys
     sys.path.append('./circuitry')
-    from circuitry import bit, bits, constants, synthesize
+    from circuitry import bit, bits, constants, evaluate_many, synthesize
 
 @synthesize
 def equal(x: bit, y: bit) -> bit:
@@ -222,7 +222,7 @@ class Test_circuitry(TestCase):
         self.assertTrue({
             'bit', 'constant', 'input', 'input_one', 'input_two', 'output', \
             'bits', 'constants', 'inputs', 'outputs', \
-            'synthesize'
+            'evaluate_many', 'synthesize'
         }.issubset(module.__dict__.keys()))
 
     def test_example_equal(self):
@@ -260,6 +260,44 @@ class Test_circuitry(TestCase):
                 [[int(xs == ys)]]
             )
 
+    def test_example_equals_functional_evaluate_many(self):
+        """
+        Tests evaluation of a synthesized circuit on a batch of inputs in a
+        single pass.
+        """
+        vectors = list(product(*[[0, 1]] * 8))
+        pairs = list(product(vectors, vectors))
+        self.assertEqual(
+            evaluate_many(equals_functional.circuit, [[xs, ys] for (xs, ys) in pairs]),
+            [[[int(xs == ys)]] for (xs, ys) in pairs]
+        )
+
+    def test_example_equals_functional_evaluate_many_large_batch(self):
+        """
+        Tests that evaluation of a synthesized circuit on a large batch of
+        random inputs matches the evaluation of the circuit on each input.
+        """
+        inputs_ = []
+        for _ in range(2 ** 14):
+            xs = [secrets.randbits(1) for _ in range(8)]
+            ys = xs if secrets.randbits(1) else [secrets.randbits(1) for _ in range(8)]
+            inputs_.append([xs, ys])
+
+        self.assertEqual(
+            evaluate_many(equals_functional.circuit, inputs_),
+            [equals_functional.circuit.evaluate(i) for i in inputs_]
+        )
+
+    def test_evaluate_many_invalid_inputs(self):
+        """
+        Tests that a batch of inputs that do not match the signature of a
+        synthesized circuit is rejected.
+        """
+        with self.assertRaises(ValueError):
+            evaluate_many(equals_functional.circuit, [[[0] * 8, [0] * 8], [[0] * 8, [0] * 7]])
+        with self.assertRaises(TypeError):
+            evaluate_many(equals_functional.circuit, [[0] * 16])
+
     def test_example_sha256(self):
         """
         Tests the circuit corresponding to an implementation of SHA-256 that was